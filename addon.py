@@ -2,14 +2,15 @@
 
 import re
 import bpy
-import mathutils
 import json
 import threading
 import socket
+import selectors
+import queue
 import time
-import requests
+import atexit
+import logging
 import tempfile
-import traceback
 import os
 import shutil
 import zipfile
@@ -19,6 +20,12 @@ from datetime import datetime
 import hashlib, hmac, base64
 import os.path as osp
 from contextlib import redirect_stdout, suppress
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import PurePosixPath
+from urllib.parse import urlparse
+from bpy.app.handlers import persistent
 
 bl_info = {
     "name": "Blender MCP",
@@ -32,9 +39,367 @@ bl_info = {
 
 RODIN_FREE_TRIAL_KEY = "vibecoding"
 
+# Server diagnostics go through a logger so per-connection/per-command
+# messages cost a level check instead of a console write. Set
+# BLENDERMCP_DEBUG=1 to see them.
+_DEBUG = bool(os.environ.get("BLENDERMCP_DEBUG"))
+logger = logging.getLogger("BlenderMCP")
+logger.setLevel(logging.DEBUG if _DEBUG else logging.INFO)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+def _log_exception(context, error):
+    """Log a caught exception; the traceback is only formatted in debug mode."""
+    logger.error("%s: %s: %s", context, type(error).__name__, error, exc_info=_DEBUG)
+
 # Add User-Agent as required by Poly Haven API
-REQ_HEADERS = requests.utils.default_headers()
-REQ_HEADERS.update({"User-Agent": "blender-mcp"})
+REQ_HEADERS = {"User-Agent": "blender-mcp"}
+
+# Shared reply encoder. Compact separators shrink every reply; ensure_ascii
+# stays on because the MCP server decodes whatever has arrived so far and
+# would choke on a multi-byte character split across reads.
+_json_encoder = json.JSONEncoder(separators=(',', ':'), check_circular=False)
+
+# orjson isn't bundled with Blender, but is used when installed into its
+# Python: it parses bytes directly and encodes straight to bytes.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_decode_command = orjson.loads if orjson is not None else json.loads
+
+def _encode_reply(obj):
+    """Serialize a reply to compact, ASCII-only JSON bytes."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+        else:
+            # orjson cannot escape non-ASCII text; those replies fall
+            # through to the stdlib encoder to keep the guarantee above
+            if data.isascii():
+                return data
+    return _json_encoder.encode(obj).encode('ascii')
+
+# Bytes that matter for finding where a JSON value ends. An escape is matched
+# together with the byte it escapes, so an escaped quote never ends a string.
+_json_frame_tokens = re.compile(rb'\\.|["{}\[\]]', re.DOTALL)
+
+# Bytes requested per recv(); execute_code payloads are often well over 8 KiB
+RECV_BUFFER_SIZE = 65536
+
+# Seconds between main-thread checks for queued commands
+COMMAND_POLL_INTERVAL = 0.01
+
+# Number of compiled execute_code scripts kept for repeat requests
+CODE_CACHE_SIZE = 128
+
+@lru_cache(maxsize=CODE_CACHE_SIZE)
+def _compile_code(code):
+    """Compile execute_code source, reusing the code object for repeats."""
+    # Same filename exec() uses for a source string, so errors read the same
+    return compile(code, "<string>", "exec")
+
+# Bumped whenever the depsgraph reports a change or a file is loaded, so
+# cached screenshots of a stale scene are never served
+_scene_generation = 0
+
+def _is_screenshot_image_update(update):
+    try:
+        id_data = update.id
+        return isinstance(id_data, bpy.types.Image) and id_data.name.startswith("mcp_viewport")
+    except ReferenceError:
+        # The temporary screenshot image is removed before the handler runs
+        return True
+
+@persistent
+def _bump_scene_generation(*args):
+    global _scene_generation
+    depsgraph = args[1] if len(args) > 1 else None
+    if depsgraph is not None:
+        # Creating/removing the add-on's own screenshot image is itself
+        # reported as an update; it doesn't change what the viewport shows.
+        # Any other image edit (painting, pixels, reload) still counts.
+        updates = depsgraph.updates
+        if len(updates) and all(_is_screenshot_image_update(u) for u in updates):
+            return
+    _scene_generation += 1
+
+def _rna_state(struct):
+    """Hashable snapshot of every plain (non-pointer) property of struct."""
+    state = []
+    for prop in struct.bl_rna.properties:
+        if prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        value = getattr(struct, prop.identifier)
+        if getattr(prop, "is_array", False):
+            value = tuple(value)
+        elif isinstance(value, set):  # enum flags
+            value = frozenset(value)
+        state.append(value)
+    return tuple(state)
+
+def _screenshot_cache_key(scene, view_layer, space, width, height, file_format):
+    """Everything an offscreen viewport capture depends on, as a hashable key."""
+    r3d = space.region_3d
+    return (
+        tuple(map(tuple, r3d.view_matrix)),
+        tuple(map(tuple, r3d.window_matrix)),
+        width, height, file_format.upper(),
+        # Viewport settings aren't ID data and fire no depsgraph update,
+        # so all of shading and overlays is part of the key
+        _rna_state(space.shading), _rna_state(space.overlay),
+        scene.name, view_layer.name, scene.frame_current,
+        _scene_generation,
+    )
+
+# Parallel HTTP downloads for the maps of one Poly Haven texture
+TEXTURE_DOWNLOAD_WORKERS = 6
+
+# Chunk size used when streaming downloads straight to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Upper bound for a generated Hyper3D model download
+MAX_GLB_BYTES = 512 << 20
+
+# (connect, read) timeout for Hyper3D API calls
+HYPER3D_TIMEOUT = (5, 60)
+
+def _copy_response(response, fileobj, max_bytes=None):
+    """Stream the body of a stream=True requests response into a binary file.
+
+    With max_bytes set, a body that is declared or turns out to be larger
+    raises ValueError instead of being written out in full.
+    """
+    # Let urllib3 undo any gzip/deflate content encoding
+    response.raw.decode_content = True
+    if max_bytes is None:
+        shutil.copyfileobj(response.raw, fileobj, DOWNLOAD_CHUNK_SIZE)
+    else:
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > max_bytes:
+            raise ValueError(f"Download is {length} bytes, over the {max_bytes} byte limit")
+        written = 0
+        while chunk := response.raw.read(DOWNLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_bytes:
+                raise ValueError(f"Download exceeds the {max_bytes} byte limit")
+            fileobj.write(chunk)
+    fileobj.flush()
+
+def _download_texture_maps(session, map_urls, file_format, tmp_paths):
+    """Download texture maps concurrently into temp files.
+
+    Each map that downloads is recorded in tmp_paths (map type -> path) as
+    soon as it finishes, so the caller can remove every file even if another
+    download raises. Maps that don't return 200 are skipped.
+    """
+    def download_map(map_type, file_url):
+        # Use a temporary file like we do for HDRIs
+        fd, tmp_path = tempfile.mkstemp(suffix=f".{file_format}")
+        downloaded = False
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                # Download the file
+                with session.get(file_url, stream=True) as response:
+                    if response.status_code == 200:
+                        _copy_response(response, tmp_file)
+                        downloaded = True
+                        tmp_paths[map_type] = tmp_path
+        finally:
+            if not downloaded:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+    # The downloads are independent and latency bound, so fetch them
+    # concurrently
+    with ThreadPoolExecutor(max_workers=TEXTURE_DOWNLOAD_WORKERS) as executor:
+        # Consumed to re-raise the first failed download
+        list(executor.map(download_map, map_urls, map_urls.values()))
+
+_temp_dir = None
+
+def _get_temp_dir():
+    """Per-process scratch directory for downloaded assets, removed at exit."""
+    global _temp_dir
+    if _temp_dir is None:
+        _temp_dir = tempfile.mkdtemp(prefix="blendermcp_")
+        atexit.register(shutil.rmtree, _temp_dir, ignore_errors=True)
+    return _temp_dir
+
+_http_session = None
+
+def _get_http_session():
+    """Shared requests session, so repeated API and CDN calls reuse connections."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Back off on gateway errors instead of failing the first poll; POSTs
+        # are left out of the default allowed methods so jobs aren't resubmitted.
+        retries = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=(502, 503, 504), raise_on_status=False)
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(REQ_HEADERS)
+        _http_session = session
+    return _http_session
+
+class _JSONFramer:
+    """Split a client byte stream into complete top-level JSON values.
+
+    Object/array depth and string state are carried across reads, so each
+    received byte is scanned once and json.loads only runs on values that
+    are known to be complete.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data):
+        """Append received bytes and return the list of completed frames."""
+        buffer = self.buffer
+        buffer.extend(data)
+        frames = []
+        start = 0
+        pos = self._pos
+        depth = self._depth
+        in_string = self._in_string
+
+        for match in _json_frame_tokens.finditer(buffer, pos):
+            pos = match.end()
+            token = match.group()
+            if in_string:
+                if token == b'"':
+                    in_string = False
+            elif token == b'"':
+                in_string = True
+            elif token == b'{' or token == b'[':
+                depth += 1
+            elif token == b'}' or token == b']':
+                depth -= 1
+                if depth <= 0:
+                    frames.append(buffer[start:pos])
+                    start = pos
+                    depth = 0
+
+        # A backslash at the very end escapes the first byte of the next
+        # read, so scan it again once that byte has arrived
+        if pos < len(buffer) and buffer[-1] == 0x5c:
+            pos = len(buffer) - 1
+        else:
+            pos = len(buffer)
+
+        if start:
+            del buffer[:start]
+            pos -= start
+        self._pos = pos
+        self._depth = depth
+        self._in_string = in_string
+        return frames
+
+class _ClientConnection:
+    """Per-client state held by the server thread's selector.
+
+    Client sockets are non-blocking. Replies that the socket can't take yet
+    wait in outgoing, and the client is watched for writability until the
+    buffer is empty, so a client that stops reading never blocks the thread.
+    """
+
+    def __init__(self):
+        self.framer = _JSONFramer()
+        self.outgoing = bytearray()
+
+def _append_blend_objects(filepath):
+    """Append every object from a .blend file into the active collection."""
+    # For blend files, we need to append or link
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+
+    # Link the objects to the scene
+    for obj in data_to.objects:
+        if obj is not None:
+            bpy.context.collection.objects.link(obj)
+
+def _import_obj(filepath):
+    """Import an OBJ file with whichever importer this Blender ships."""
+    # The legacy Python importer was removed in 4.0 in favour of the C++ one
+    if bpy.app.version >= (4, 0, 0):
+        bpy.ops.wm.obj_import(filepath=filepath)
+    else:
+        bpy.ops.import_scene.obj(filepath=filepath)
+
+# Model importers keyed on file format. The operators are looked up when
+# called, so this is safe to build before the importer add-ons are loaded.
+_MODEL_IMPORTERS = {
+    "gltf": lambda filepath: bpy.ops.import_scene.gltf(filepath=filepath),
+    "glb": lambda filepath: bpy.ops.import_scene.gltf(filepath=filepath),
+    "fbx": lambda filepath: bpy.ops.import_scene.fbx(filepath=filepath),
+    "obj": _import_obj,
+    "blend": _append_blend_objects,
+}
+
+# Poly Haven texture id -> names of the images downloaded for it, so
+# set_texture doesn't have to scan every image in the file. Names rather
+# than Image references, which would dangle after undo or a file load.
+_polyhaven_texture_index = {}
+
+# Colorspace names to try, in order of preference
+_COLOR_COLORSPACES = ("sRGB",)
+_DATA_COLORSPACES = ("Non-Color",)
+_EXR_COLORSPACES = ("Linear", "Non-Color")
+_HDR_COLORSPACES = ("Linear", "Linear Rec.709", "Non-Color")
+
+# Poly Haven map suffix (lowercased) -> how set_texture wires it
+_MAP_KIND = {
+    "color": "base", "diffuse": "base", "albedo": "base",
+    "roughness": "rough", "rough": "rough",
+    "metallic": "metal", "metalness": "metal", "metal": "metal",
+    "normal": "normal", "nor": "normal", "dx": "normal", "gl": "normal",
+    "displacement": "disp", "disp": "disp", "height": "disp",
+}
+
+# Candidate tuple -> first name the running Blender accepted ("" if none)
+_colorspace_cache = {}
+
+def _set_colorspace(image, candidates):
+    """Set the first colorspace from candidates that this Blender supports.
+
+    The available names depend on the Blender version and OCIO config, not
+    on the image, so the result of the first probe is cached and later
+    images are assigned directly instead of failing through the list.
+    Assigning a colorspace makes Blender re-evaluate the image, so an
+    image that already has the wanted one is left untouched.
+    """
+    name = _colorspace_cache.get(candidates)
+    if name is not None:
+        if name and image.colorspace_settings.name != name:
+            image.colorspace_settings.name = name
+        return
+
+    for name in candidates:
+        if image.colorspace_settings.name == name:
+            _colorspace_cache[candidates] = name
+            return
+        try:
+            image.colorspace_settings.name = name
+        except TypeError:
+            continue
+        _colorspace_cache[candidates] = name
+        return
+    _colorspace_cache[candidates] = ""
 
 def get_blendermcp_addon_preferences(context=None):
     """Get add-on preferences object if available."""
@@ -50,8 +415,27 @@ class BlenderMCPServer:
         self.running = False
         self.socket = None
         self.server_thread = None
-
-    def _get_config_value(self, scene_attr, pref_attr=None, env_var=None):
+        # Commands parsed by the server thread, run on the main thread by a
+        # single timer. The bound method is stored once because Blender
+        # matches registered timers by identity.
+        self._command_queue = queue.Queue()
+        # Encoded replies handed back to the server thread for sending, so a
+        # slow client never blocks Blender's main thread
+        self._reply_queue = queue.Queue()
+        # One dispatch table per combination of enabled integrations,
+        # indexed by the bitmask built in _execute_command_internal
+        self._handler_tables = [
+            self._build_handlers(bool(mask & 1), bool(mask & 2), bool(mask & 4), bool(mask & 8))
+            for mask in range(16)
+        ]
+        self._drain_timer = self._drain_commands
+        # (key, encoded image) of the last offscreen viewport capture
+        self._last_screenshot = None
+        # Self-pipe used by stop() to wake the accept loop immediately
+        self._wake_r = None
+        self._wake_w = None
+
+    def _get_config_value(self, scene_attr, pref_attr=None, env_var=None, scene=None):
         """Read config in order: addon preferences -> scene -> env var."""
         prefs = get_blendermcp_addon_preferences()
         if prefs and pref_attr:
@@ -59,7 +443,9 @@ class BlenderMCPServer:
             if pref_value:
                 return pref_value
 
-        scene_value = getattr(bpy.context.scene, scene_attr, "")
+        if scene is None:
+            scene = bpy.context.scene
+        scene_value = getattr(scene, scene_attr, "")
         if scene_value:
             return scene_value
 
@@ -69,16 +455,19 @@ class BlenderMCPServer:
                 return env_value
         return ""
 
-    def _get_hyper3d_api_key(self):
+    def _get_hyper3d_api_key(self, scene=None):
         # Let the free-trial button temporarily override persistent keys
         # without overwriting user-saved private keys.
-        scene_value = getattr(bpy.context.scene, "blendermcp_hyper3d_api_key", "")
+        if scene is None:
+            scene = bpy.context.scene
+        scene_value = getattr(scene, "blendermcp_hyper3d_api_key", "")
         if scene_value == RODIN_FREE_TRIAL_KEY:
             return scene_value
         return self._get_config_value(
             "blendermcp_hyper3d_api_key",
             "hyper3d_api_key",
             "BLENDERMCP_HYPER3D_API_KEY",
+            scene=scene,
         )
 
     def _get_sketchfab_api_key(self):
@@ -111,12 +500,12 @@ class BlenderMCPServer:
 
     def start(self):
         if bpy.app.background:
-            print("BlenderMCP: cannot start server in background mode (blender -b) - commands would never execute\n"
-                  "BlenderMCP: run Blender with a GUI, or use a virtual display: xvfb-run -a blender")
+            logger.warning("BlenderMCP: cannot start server in background mode (blender -b) - commands would never execute\n"
+                           "BlenderMCP: run Blender with a GUI, or use a virtual display: xvfb-run -a blender")
             return
 
         if self.running:
-            print("Server is already running")
+            logger.info("Server is already running")
             return
 
         self.running = True
@@ -126,21 +515,40 @@ class BlenderMCPServer:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
+            self.socket.listen(socket.SOMAXCONN)
+
+            # socketpair rather than os.pipe so selectors also works on Windows
+            self._wake_r, self._wake_w = socket.socketpair()
+            # A full wake buffer already guarantees a wake-up, so never block
+            self._wake_w.setblocking(False)
+
+            # Start the main-thread command timer
+            if not bpy.app.timers.is_registered(self._drain_timer):
+                bpy.app.timers.register(self._drain_timer, first_interval=0.0, persistent=True)
 
             # Start server thread
             self.server_thread = threading.Thread(target=self._server_loop)
             self.server_thread.daemon = True
             self.server_thread.start()
 
-            print(f"BlenderMCP server started on {self.host}:{self.port}")
+            logger.info("BlenderMCP server started on %s:%s", self.host, self.port)
         except Exception as e:
-            print(f"Failed to start server: {str(e)}")
+            logger.error("Failed to start server: %s", e)
             self.stop()
 
     def stop(self):
         self.running = False
 
+        if bpy.app.timers.is_registered(self._drain_timer):
+            bpy.app.timers.unregister(self._drain_timer)
+
+        # Wake the server loop out of select()
+        if self._wake_w:
+            try:
+                self._wake_w.send(b'\0')
+            except OSError:
+                pass
+
         # Close socket
         if self.socket:
             try:
@@ -158,120 +566,202 @@ class BlenderMCPServer:
                 pass
             self.server_thread = None
 
-        print("BlenderMCP server stopped")
+        for wake in (self._wake_r, self._wake_w):
+            if wake:
+                try:
+                    wake.close()
+                except OSError:
+                    pass
+        self._wake_r = None
+        self._wake_w = None
+
+        logger.info("BlenderMCP server stopped")
 
     def _server_loop(self):
         """Main server loop in a separate thread"""
-        print("Server thread started")
-        self.socket.settimeout(1.0)  # Timeout to allow for stopping
+        logger.debug("Server thread started")
 
-        while self.running:
-            try:
-                # Accept new connection
-                try:
-                    client, address = self.socket.accept()
-                    print(f"Connected to client: {address}")
+        # One selector covers the listening socket, every connected client
+        # and the wake socket, so this thread blocks until any of them is
+        # readable and no thread is tied up per client. Listener and wake
+        # socket carry no data; each client carries its _ClientConnection.
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ)
+        selector.register(self._wake_r, selectors.EVENT_READ)
 
-                    # Handle client in a separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client,)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except socket.timeout:
-                    # Just check running condition
-                    continue
-                except Exception as e:
-                    print(f"Error accepting connection: {str(e)}")
-                    time.sleep(0.5)
-            except Exception as e:
-                print(f"Error in server loop: {str(e)}")
-                if not self.running:
-                    break
-                time.sleep(0.5)
-
-        print("Server thread stopped")
-
-    def _handle_client(self, client):
-        """Handle connected client"""
-        print("Client handler started")
-        client.settimeout(None)  # No timeout
-        buffer = b''
+        # All clients are read on this thread, so they share one buffer
+        recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        recv_view = memoryview(recv_buffer)
 
         try:
             while self.running:
-                # Receive data
                 try:
-                    data = client.recv(8192)
-                    if not data:
-                        print("Client disconnected")
+                    for key, events in selector.select():
+                        if key.fileobj is self._wake_r:
+                            # Woken either by stop() or by queued replies
+                            self._wake_r.recv(4096)
+                            if not self.running:
+                                return
+                            self._send_replies(selector)
+                            continue
+                        if key.fileobj is self.socket:
+                            self._accept_client(selector)
+                            continue
+                        client = key.fileobj
+                        if events & selectors.EVENT_WRITE:
+                            self._flush_client(selector, client, key.data)
+                        # The client may have been closed earlier in this batch
+                        if events & selectors.EVENT_READ and client.fileno() != -1:
+                            self._read_client(selector, client, key.data, recv_buffer, recv_view)
+                except Exception as e:
+                    logger.error("Error in server loop: %s", e)
+                    if not self.running:
                         break
-
-                    buffer += data
+                    time.sleep(0.5)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
                     try:
-                        # Try to parse command
-                        command = json.loads(buffer.decode('utf-8'))
-                        buffer = b''
-
-                        # Execute command in Blender's main thread
-                        def execute_wrapper():
-                            try:
-                                response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode('utf-8'))
-                                except:
-                                    print("Failed to send response - client disconnected")
-                            except Exception as e:
-                                print(f"Error executing command: {str(e)}")
-                                traceback.print_exc()
-                                try:
-                                    error_response = {
-                                        "status": "error",
-                                        "message": str(e)
-                                    }
-                                    client.sendall(json.dumps(error_response).encode('utf-8'))
-                                except:
-                                    pass
-                            return None
-
-                        # Schedule execution in main thread
-                        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
-                    except json.JSONDecodeError:
-                        # Incomplete data, wait for more
+                        key.fileobj.close()
+                    except OSError:
                         pass
-                except Exception as e:
-                    print(f"Error receiving data: {str(e)}")
-                    break
+            selector.close()
+            logger.debug("Server thread stopped")
+
+    def _accept_client(self, selector):
+        """Accept a pending connection and start watching it for commands"""
+        try:
+            client, address = self.socket.accept()
+            logger.debug("Connected to client: %s", address)
+
+            # Commands and replies are small request/response
+            # messages, so don't let Nagle hold them back
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            client.setblocking(False)
+            selector.register(client, selectors.EVENT_READ, _ClientConnection())
         except Exception as e:
-            print(f"Error in client handler: {str(e)}")
-        finally:
-            try:
-                client.close()
-            except:
-                pass
-            print("Client handler stopped")
+            logger.error("Error accepting connection: %s", e)
+            time.sleep(0.5)
 
-    def execute_command(self, command):
-        """Execute a command in the main Blender thread"""
+    def _close_client(self, selector, client):
+        """Stop watching a client and close its socket"""
+        try:
+            selector.unregister(client)
+        except (KeyError, ValueError):
+            pass
         try:
-            return self._execute_command_internal(command)
+            client.close()
+        except OSError:
+            pass
+
+    def _read_client(self, selector, client, connection, recv_buffer, recv_view):
+        """Read what a readable client sent and schedule complete commands"""
+        try:
+            size = client.recv_into(recv_buffer)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.error("Error receiving data: %s", e)
+            size = 0
 
+        if not size:
+            logger.debug("Client disconnected")
+            self._close_client(selector, client)
+            return
+
+        for frame in connection.framer.feed(recv_view[:size]):
+            try:
+                command = _decode_command(frame)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.error("Discarding malformed command: %s", e)
+                continue
+            self._schedule_command(client, command)
+
+    def _schedule_command(self, client, command):
+        """Queue a parsed command for execution on Blender's main thread"""
+        self._command_queue.put((client, command))
+
+    def _drain_commands(self):
+        """Timer callback: run every queued command, then poll again"""
+        while True:
+            try:
+                client, command = self._command_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._run_command(client, command)
+        return COMMAND_POLL_INTERVAL
+
+    def _run_command(self, client, command):
+        """Execute a command and queue the reply for its client"""
+        try:
+            response = self.execute_command(command)
+            self._queue_reply(client, _encode_reply(response))
         except Exception as e:
-            print(f"Error executing command: {str(e)}")
-            traceback.print_exc()
-            return {"status": "error", "message": str(e)}
+            _log_exception("Error executing command", e)
+            error_response = {
+                "status": "error",
+                "message": str(e)
+            }
+            self._queue_reply(client, _encode_reply(error_response))
 
-    def _execute_command_internal(self, command):
-        """Internal command execution with proper context"""
-        cmd_type = command.get("type")
-        params = command.get("params", {})
+    def _queue_reply(self, client, data):
+        """Hand an encoded reply to the server thread and wake it to send it"""
+        self._reply_queue.put((client, data))
+        try:
+            self._wake_w.send(b'\1')
+        except (AttributeError, OSError):
+            # Wake buffer already full, or the server is shutting down
+            pass
 
-        # Add a handler for checking PolyHaven status
-        if cmd_type == "get_polyhaven_status":
-            return {"status": "success", "result": self.get_polyhaven_status()}
+    def _send_replies(self, selector):
+        """Buffer every queued reply and send what the sockets accept now"""
+        while True:
+            try:
+                client, data = self._reply_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection = selector.get_key(client).data
+            except (KeyError, ValueError):
+                logger.warning("Failed to send response - client disconnected")
+                continue
+            # With bytes already pending, the client is watched for
+            # writability and this reply goes out after them
+            pending = bool(connection.outgoing)
+            connection.outgoing += data
+            if not pending:
+                self._flush_client(selector, client, connection)
+
+    def _flush_client(self, selector, client, connection):
+        """Send as much buffered reply data as the client socket accepts"""
+        outgoing = connection.outgoing
+        try:
+            while outgoing:
+                sent = client.send(outgoing)
+                del outgoing[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            logger.warning("Failed to send response - client disconnected")
+            self._close_client(selector, client)
+            return
+
+        events = selectors.EVENT_READ
+        if outgoing:
+            events |= selectors.EVENT_WRITE
+        if selector.get_key(client).events != events:
+            selector.modify(client, events, connection)
 
+    def execute_command(self, command):
+        """Execute a command in the main Blender thread"""
+        # Handler errors become error replies inside _execute_command_internal;
+        # anything else is reported by the caller (_run_command)
+        return self._execute_command_internal(command)
+
+    def _build_handlers(self, use_polyhaven, use_hyper3d, use_sketchfab, use_hunyuan3d):
+        """Build the command dispatch table for the enabled integrations"""
         # Base handlers that are always available
         handlers = {
             "get_scene_info": self.get_scene_info,
@@ -286,7 +776,7 @@ class BlenderMCPServer:
         }
 
         # Add Polyhaven handlers only if enabled
-        if bpy.context.scene.blendermcp_use_polyhaven:
+        if use_polyhaven:
             polyhaven_handlers = {
                 "get_polyhaven_categories": self.get_polyhaven_categories,
                 "search_polyhaven_assets": self.search_polyhaven_assets,
@@ -296,7 +786,7 @@ class BlenderMCPServer:
             handlers.update(polyhaven_handlers)
 
         # Add Hyper3d handlers only if enabled
-        if bpy.context.scene.blendermcp_use_hyper3d:
+        if use_hyper3d:
             polyhaven_handlers = {
                 "create_rodin_job": self.create_rodin_job,
                 "poll_rodin_job_status": self.poll_rodin_job_status,
@@ -305,7 +795,7 @@ class BlenderMCPServer:
             handlers.update(polyhaven_handlers)
 
         # Add Sketchfab handlers only if enabled
-        if bpy.context.scene.blendermcp_use_sketchfab:
+        if use_sketchfab:
             sketchfab_handlers = {
                 "search_sketchfab_models": self.search_sketchfab_models,
                 "get_sketchfab_model_preview": self.get_sketchfab_model_preview,
@@ -314,7 +804,7 @@ class BlenderMCPServer:
             handlers.update(sketchfab_handlers)
         
         # Add Hunyuan3d handlers only if enabled
-        if bpy.context.scene.blendermcp_use_hunyuan3d:
+        if use_hunyuan3d:
             hunyuan_handlers = {
                 "create_hunyuan_job": self.create_hunyuan_job,
                 "poll_hunyuan_job_status": self.poll_hunyuan_job_status,
@@ -322,16 +812,35 @@ class BlenderMCPServer:
             }
             handlers.update(hunyuan_handlers)
 
-        handler = handlers.get(cmd_type)
+        return handlers
+
+    def _execute_command_internal(self, command):
+        """Internal command execution with proper context"""
+        cmd_type = command.get("type")
+        params = command.get("params", {})
+
+        # Add a handler for checking PolyHaven status
+        if cmd_type == "get_polyhaven_status":
+            return {"status": "success", "result": self.get_polyhaven_status()}
+
+        scene = bpy.context.scene
+
+        # The handler table only depends on which integrations are enabled
+        mask = (
+            scene.blendermcp_use_polyhaven
+            | scene.blendermcp_use_hyper3d << 1
+            | scene.blendermcp_use_sketchfab << 2
+            | scene.blendermcp_use_hunyuan3d << 3
+        )
+        handler = self._handler_tables[mask].get(cmd_type)
         if handler:
             try:
-                print(f"Executing handler for {cmd_type}")
+                logger.debug("Executing handler for %s", cmd_type)
                 result = handler(**params)
-                print(f"Handler execution complete")
+                logger.debug("Handler execution complete")
                 return {"status": "success", "result": result}
             except Exception as e:
-                print(f"Error in handler: {str(e)}")
-                traceback.print_exc()
+                _log_exception("Error in handler", e)
                 return {"status": "error", "message": str(e)}
         else:
             return {"status": "error", "message": f"Unknown command type: {cmd_type}"}
@@ -341,35 +850,29 @@ class BlenderMCPServer:
     def get_scene_info(self):
         """Get information about the current Blender scene"""
         try:
-            print("Getting scene info...")
+            logger.debug("Getting scene info...")
+            scene = bpy.context.scene
             # Simplify the scene info to reduce data size
             scene_info = {
-                "name": bpy.context.scene.name,
-                "object_count": len(bpy.context.scene.objects),
-                "objects": [],
+                "name": scene.name,
+                "object_count": len(scene.objects),
+                # Collect minimal object information (limit to first 10 objects)
+                "objects": [
+                    {
+                        "name": obj.name,
+                        "type": obj.type,
+                        # Only include basic location data
+                        "location": list(obj.location.to_tuple(2)),
+                    }
+                    for obj in islice(scene.objects, 10)  # Reduced from 20 to 10
+                ],
                 "materials_count": len(bpy.data.materials),
             }
 
-            # Collect minimal object information (limit to first 10 objects)
-            for i, obj in enumerate(bpy.context.scene.objects):
-                if i >= 10:  # Reduced from 20 to 10
-                    break
-
-                obj_info = {
-                    "name": obj.name,
-                    "type": obj.type,
-                    # Only include basic location data
-                    "location": [round(float(obj.location.x), 2),
-                                round(float(obj.location.y), 2),
-                                round(float(obj.location.z), 2)],
-                }
-                scene_info["objects"].append(obj_info)
-
-            print(f"Scene info collected: {len(scene_info['objects'])} objects")
+            logger.debug("Scene info collected: %d objects", len(scene_info["objects"]))
             return scene_info
         except Exception as e:
-            print(f"Error in get_scene_info: {str(e)}")
-            traceback.print_exc()
+            _log_exception("Error in get_scene_info", e)
             return {"error": str(e)}
 
     @staticmethod
@@ -378,22 +881,46 @@ class BlenderMCPServer:
         if obj.type != 'MESH':
             raise TypeError("Object must be a mesh")
 
-        # Get the bounding box corners in local space
-        local_bbox_corners = [mathutils.Vector(corner) for corner in obj.bound_box]
+        import numpy as np
 
-        # Convert to world coordinates
-        world_bbox_corners = [obj.matrix_world @ corner for corner in local_bbox_corners]
+        # Bounding box corners in local space, as homogeneous coordinates
+        corners = np.ones((8, 4))
+        corners[:, :3] = obj.bound_box
 
-        # Compute axis-aligned min/max coordinates
-        min_corner = mathutils.Vector(map(min, zip(*world_bbox_corners)))
-        max_corner = mathutils.Vector(map(max, zip(*world_bbox_corners)))
+        # Transform all corners to world space in one matmul
+        world_corners = corners @ np.array(obj.matrix_world).T
 
+        # Compute axis-aligned min/max coordinates
         return [
-            [*min_corner], [*max_corner]
+            world_corners[:, :3].min(axis=0).tolist(),
+            world_corners[:, :3].max(axis=0).tolist(),
         ]
 
 
 
+    @staticmethod
+    def _get_combined_aabb(objs):
+        """ Returns the world-space AABB enclosing several mesh objects. """
+        import numpy as np
+
+        boxes = np.array([BlenderMCPServer._get_aabb(obj) for obj in objs])
+        return [boxes[:, 0].min(axis=0).tolist(), boxes[:, 1].max(axis=0).tolist()]
+
+    def _obj_to_result(self, obj):
+        """Name, type, transform and mesh bounds of an imported object."""
+        result = {
+            "name": obj.name,
+            "type": obj.type,
+            "location": list(obj.location),
+            "rotation": list(obj.rotation_euler),
+            "scale": list(obj.scale),
+        }
+
+        if obj.type == "MESH":
+            result["world_bounding_box"] = self._get_aabb(obj)
+
+        return result
+
     def get_object_info(self, name):
         """Get detailed information about a specific object"""
         obj = bpy.data.objects.get(name)
@@ -404,9 +931,9 @@ class BlenderMCPServer:
         obj_info = {
             "name": obj.name,
             "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "location": list(obj.location),
+            "rotation": list(obj.rotation_euler),
+            "scale": list(obj.scale),
             "visible": obj.visible_get(),
             "materials": [],
         }
@@ -477,29 +1004,45 @@ class BlenderMCPServer:
                 else:
                     width, height = src_w, src_h
 
-                offscreen = gpu.types.GPUOffScreen(width, height)
-                try:
-                    offscreen.draw_view3d(
-                        bpy.context.scene, bpy.context.view_layer, space, region,
-                        r3d.view_matrix, r3d.window_matrix, do_color_management=True,
-                    )
-                    buf = offscreen.texture_color.read()
-                finally:
-                    offscreen.free()
+                scene = bpy.context.scene
+                # Flush edits made earlier in the same timer tick so the
+                # depsgraph handler has bumped _scene_generation for them
+                bpy.context.view_layer.update()
+                cache_key = _screenshot_cache_key(
+                    scene, bpy.context.view_layer, space, width, height, format)
+                last = self._last_screenshot
+                if last is not None and last[0] == cache_key:
+                    # Same view of an unchanged scene: reuse the encoded image
+                    with open(filepath, 'wb') as f:
+                        f.write(last[1])
+                else:
+                    offscreen = gpu.types.GPUOffScreen(width, height)
+                    try:
+                        offscreen.draw_view3d(
+                            scene, bpy.context.view_layer, space, region,
+                            r3d.view_matrix, r3d.window_matrix, do_color_management=True,
+                        )
+                        buf = offscreen.texture_color.read()
+                    finally:
+                        offscreen.free()
 
-                buf.dimensions = width * height * 4
-                pixels = np.asarray(buf, dtype=np.float32) / 255.0  # GPU buffer is 0..255
+                    buf.dimensions = width * height * 4
+                    pixels = np.asarray(buf, dtype=np.float32) / 255.0  # GPU buffer is 0..255
 
-                image = bpy.data.images.new("mcp_viewport", width, height, alpha=True)
-                image.pixels.foreach_set(pixels.ravel())
-                image.filepath_raw = filepath
-                image.file_format = format.upper()
-                image.save()
-                bpy.data.images.remove(image)
+                    image = bpy.data.images.new("mcp_viewport", width, height, alpha=True)
+                    image.pixels.foreach_set(pixels.ravel())
+                    image.filepath_raw = filepath
+                    image.file_format = format.upper()
+                    image.save()
+                    bpy.data.images.remove(image)
+
+                    # Only the latest capture is kept, for immediate repeats
+                    with open(filepath, 'rb') as f:
+                        self._last_screenshot = (cache_key, f.read())
 
             except Exception as offscreen_err:
-                print(f"[BlenderMCP] offscreen capture failed ({offscreen_err}); "
-                      "falling back to window grab", flush=True)
+                logger.warning("Offscreen capture failed (%s); falling back to window grab",
+                               offscreen_err)
                 method = "window_grab"
                 with bpy.context.temp_override(area=area):
                     bpy.ops.screen.screenshot_area(filepath=filepath)
@@ -534,7 +1077,7 @@ class BlenderMCPServer:
             # Capture stdout during execution, and return it as result
             capture_buffer = io.StringIO()
             with redirect_stdout(capture_buffer):
-                exec(code, namespace)
+                exec(_compile_code(code), namespace)
 
             captured_output = capture_buffer.getvalue()
             return {"executed": True, "result": captured_output}
@@ -545,11 +1088,12 @@ class BlenderMCPServer:
 
     def get_polyhaven_categories(self, asset_type):
         """Get categories for a specific asset type from Polyhaven"""
+        session = _get_http_session()
         try:
             if asset_type not in ["hdris", "textures", "models", "all"]:
                 return {"error": f"Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"}
 
-            response = requests.get(f"https://api.polyhaven.com/categories/{asset_type}", headers=REQ_HEADERS)
+            response = session.get(f"https://api.polyhaven.com/categories/{asset_type}")
             if response.status_code == 200:
                 return {"categories": response.json()}
             else:
@@ -559,6 +1103,7 @@ class BlenderMCPServer:
 
     def search_polyhaven_assets(self, asset_type=None, categories=None):
         """Search for assets from Polyhaven with optional filtering"""
+        session = _get_http_session()
         try:
             url = "https://api.polyhaven.com/assets"
             params = {}
@@ -571,16 +1116,12 @@ class BlenderMCPServer:
             if categories:
                 params["categories"] = categories
 
-            response = requests.get(url, params=params, headers=REQ_HEADERS)
+            response = session.get(url, params=params, timeout=30)
             if response.status_code == 200:
                 # Limit the response size to avoid overwhelming Blender
                 assets = response.json()
                 # Return only the first 20 assets to keep response size manageable
-                limited_assets = {}
-                for i, (key, value) in enumerate(assets.items()):
-                    if i >= 20:  # Limit to 20 assets
-                        break
-                    limited_assets[key] = value
+                limited_assets = dict(islice(assets.items(), 20))
 
                 return {"assets": limited_assets, "total_count": len(assets), "returned_count": len(limited_assets)}
             else:
@@ -589,9 +1130,10 @@ class BlenderMCPServer:
             return {"error": str(e)}
 
     def download_polyhaven_asset(self, asset_id, asset_type, resolution="1k", file_format=None):
+        session = _get_http_session()
         try:
             # First get the files information
-            files_response = requests.get(f"https://api.polyhaven.com/files/{asset_id}", headers=REQ_HEADERS)
+            files_response = session.get(f"https://api.polyhaven.com/files/{asset_id}")
             if files_response.status_code != 200:
                 return {"error": f"Failed to get asset files: {files_response.status_code}"}
 
@@ -609,16 +1151,17 @@ class BlenderMCPServer:
 
                     # For HDRIs, we need to save to a temporary file first
                     # since Blender can't properly load HDR data directly from memory
-                    with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                        # Download the file
-                        response = requests.get(file_url, headers=REQ_HEADERS)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download HDRI: {response.status_code}"}
+                    fd, tmp_path = tempfile.mkstemp(suffix=f".{file_format}")
+                    hdri_image = None
+                    try:
+                        with os.fdopen(fd, "wb") as tmp_file:
+                            # Download the file
+                            with session.get(file_url, stream=True) as response:
+                                if response.status_code != 200:
+                                    return {"error": f"Failed to download HDRI: {response.status_code}"}
 
-                        tmp_file.write(response.content)
-                        tmp_path = tmp_file.name
+                                _copy_response(response, tmp_file)
 
-                    try:
                         # Create a new world if none exists
                         if not bpy.data.worlds:
                             bpy.data.worlds.new("World")
@@ -641,24 +1184,14 @@ class BlenderMCPServer:
                         # Load the image from the temporary file
                         env_tex = node_tree.nodes.new(type='ShaderNodeTexEnvironment')
                         env_tex.location = (-400, 0)
-                        env_tex.image = bpy.data.images.load(tmp_path)
+                        hdri_image = bpy.data.images.load(tmp_path)
+                        env_tex.image = hdri_image
 
                         # Use a color space that exists in all Blender versions
                         if file_format.lower() == 'exr':
-                            # Try to use Linear color space for EXR files
-                            try:
-                                env_tex.image.colorspace_settings.name = 'Linear'
-                            except:
-                                # Fallback to Non-Color if Linear isn't available
-                                env_tex.image.colorspace_settings.name = 'Non-Color'
+                            _set_colorspace(env_tex.image, _EXR_COLORSPACES)
                         else:  # hdr
-                            # For HDR files, try these options in order
-                            for color_space in ['Linear', 'Linear Rec.709', 'Non-Color']:
-                                try:
-                                    env_tex.image.colorspace_settings.name = color_space
-                                    break  # Stop if we successfully set a color space
-                                except:
-                                    continue
+                            _set_colorspace(env_tex.image, _HDR_COLORSPACES)
 
                         background = node_tree.nodes.new(type='ShaderNodeBackground')
                         background.location = (-200, 0)
@@ -675,11 +1208,8 @@ class BlenderMCPServer:
                         # Set as active world
                         bpy.context.scene.world = world
 
-                        # Clean up temporary file
-                        try:
-                            tempfile._cleanup()  # This will clean up all temporary files
-                        except:
-                            pass
+                        # Pack the HDRI so the temporary file can be removed
+                        env_tex.image.pack()
 
                         return {
                             "success": True,
@@ -687,7 +1217,15 @@ class BlenderMCPServer:
                             "image_name": env_tex.image.name
                         }
                     except Exception as e:
+                        # Don't leave the unpacked image pointing at the temp
+                        # file removed below
+                        if hdri_image is not None:
+                            bpy.data.images.remove(hdri_image)
                         return {"error": f"Failed to set up HDRI in Blender: {str(e)}"}
+                    finally:
+                        # Clean up temporary file, also after a failed download
+                        with suppress(OSError):
+                            os.unlink(tmp_path)
                 else:
                     return {"error": f"Requested resolution or format not available for this HDRI"}
 
@@ -696,52 +1234,41 @@ class BlenderMCPServer:
                     file_format = "jpg"  # Default format for textures
 
                 downloaded_maps = {}
+                tmp_paths = {}
 
                 try:
+                    map_urls = {}
                     for map_type in files_data:
                         if map_type not in ["blend", "gltf"]:  # Skip non-texture files
                             if resolution in files_data[map_type] and file_format in files_data[map_type][resolution]:
                                 file_info = files_data[map_type][resolution][file_format]
-                                file_url = file_info["url"]
-
-                                # Use NamedTemporaryFile like we do for HDRIs
-                                with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                                    # Download the file
-                                    response = requests.get(file_url, headers=REQ_HEADERS)
-                                    if response.status_code == 200:
-                                        tmp_file.write(response.content)
-                                        tmp_path = tmp_file.name
-
-                                        # Load image from temporary file
-                                        image = bpy.data.images.load(tmp_path)
-                                        image.name = f"{asset_id}_{map_type}.{file_format}"
-
-                                        # Pack the image into .blend file
-                                        image.pack()
-
-                                        # Set color space based on map type
-                                        if map_type in ['color', 'diffuse', 'albedo']:
-                                            try:
-                                                image.colorspace_settings.name = 'sRGB'
-                                            except:
-                                                pass
-                                        else:
-                                            try:
-                                                image.colorspace_settings.name = 'Non-Color'
-                                            except:
-                                                pass
-
-                                        downloaded_maps[map_type] = image
-
-                                        # Clean up temporary file
-                                        try:
-                                            os.unlink(tmp_path)
-                                        except:
-                                            pass
+                                map_urls[map_type] = file_info["url"]
+
+                    # bpy calls below stay on the main thread
+                    _download_texture_maps(session, map_urls, file_format, tmp_paths)
+
+                    for map_type in map_urls:
+                        tmp_path = tmp_paths.get(map_type)
+                        if tmp_path is None:
+                            continue
+
+                        # Load image from temporary file
+                        image = bpy.data.images.load(tmp_path)
+                        image.name = f"{asset_id}_{map_type}.{file_format}"
+
+                        # Set color space based on map type
+                        if map_type in ['color', 'diffuse', 'albedo']:
+                            _set_colorspace(image, _COLOR_COLORSPACES)
+                        else:
+                            _set_colorspace(image, _DATA_COLORSPACES)
+
+                        downloaded_maps[map_type] = image
 
                     if not downloaded_maps:
                         return {"error": f"No texture maps found for the requested resolution and format"}
 
+                    _polyhaven_texture_index[asset_id] = [image.name for image in downloaded_maps.values()]
+
                     # Create a new material with the downloaded textures
                     mat = bpy.data.materials.new(name=asset_id)
                     mat.use_nodes = True
@@ -782,15 +1309,9 @@ class BlenderMCPServer:
 
                         # Set color space based on map type
                         if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                            try:
-                                tex_node.image.colorspace_settings.name = 'sRGB'
-                            except:
-                                pass  # Use default if sRGB not available
+                            _set_colorspace(tex_node.image, _COLOR_COLORSPACES)
                         else:
-                            try:
-                                tex_node.image.colorspace_settings.name = 'Non-Color'
-                            except:
-                                pass  # Use default if Non-Color not available
+                            _set_colorspace(tex_node.image, _DATA_COLORSPACES)
 
                         links.new(mapping.outputs['Vector'], tex_node.inputs['Vector'])
 
@@ -816,6 +1337,11 @@ class BlenderMCPServer:
 
                         y_pos -= 250
 
+                    # Pack the images into .blend file in one pass once the
+                    # material is wired up
+                    for image in downloaded_maps.values():
+                        image.pack()
+
                     return {
                         "success": True,
                         "message": f"Texture {asset_id} imported as material",
@@ -824,7 +1350,17 @@ class BlenderMCPServer:
                     }
 
                 except Exception as e:
+                    # The images are only packed once the material is done;
+                    # don't leave them pointing at the temp files removed below
+                    for image in downloaded_maps.values():
+                        bpy.data.images.remove(image)
+                    _polyhaven_texture_index.pop(asset_id, None)
                     return {"error": f"Failed to process textures: {str(e)}"}
+                finally:
+                    # Clean up temporary files
+                    for tmp_path in tmp_paths.values():
+                        with suppress(OSError):
+                            os.unlink(tmp_path)
 
             elif asset_type == "models":
                 # For models, prefer glTF format if available
@@ -841,18 +1377,20 @@ class BlenderMCPServer:
 
                     try:
                         # Download the main model file
-                        main_file_name = file_url.split("/")[-1]
+                        main_file_name = PurePosixPath(urlparse(file_url).path).name
                         main_file_path = os.path.join(temp_dir, main_file_name)
 
-                        response = requests.get(file_url, headers=REQ_HEADERS)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download model: {response.status_code}"}
+                        with session.get(file_url, stream=True) as response:
+                            if response.status_code != 200:
+                                return {"error": f"Failed to download model: {response.status_code}"}
 
-                        with open(main_file_path, "wb") as f:
-                            f.write(response.content)
+                            with open(main_file_path, "wb") as f:
+                                _copy_response(response, f)
 
                         # Check for included files and download them
                         if "include" in file_info and file_info["include"]:
+                            includes = []
+                            abs_temp_dir = os.path.abspath(temp_dir)
                             for include_path, include_info in file_info["include"].items():
                                 # Get the URL for the included file - this is the fix
                                 include_url = include_info["url"]
@@ -863,44 +1401,33 @@ class BlenderMCPServer:
                                 # and write arbitrary files (e.g. ~/.bashrc, authorized_keys).
                                 # Mirrors the zip-slip check in download_sketchfab_model.
                                 target_path = os.path.join(temp_dir, os.path.normpath(include_path))
-                                abs_temp_dir = os.path.abspath(temp_dir)
                                 abs_target_path = os.path.abspath(target_path)
                                 if (os.path.isabs(include_path)
                                         or ".." in include_path
                                         or not abs_target_path.startswith(abs_temp_dir + os.sep)):
-                                    print(f"Skipping include with unsafe path: {include_path}")
+                                    logger.warning("Skipping include with unsafe path: %s", include_path)
                                     continue
+                                includes.append((include_path, target_path, include_url))
 
-                                # Create the directory structure for the included file
-                                include_file_path = target_path
-                                os.makedirs(os.path.dirname(include_file_path), exist_ok=True)
+                            # Create the directory structure once per distinct directory;
+                            # textures usually share one or two folders
+                            for include_dir in {os.path.dirname(target) for _, target, _ in includes}:
+                                os.makedirs(include_dir, exist_ok=True)
 
+                            for include_path, include_file_path, include_url in includes:
                                 # Download the included file
-                                include_response = requests.get(include_url, headers=REQ_HEADERS)
-                                if include_response.status_code == 200:
-                                    with open(include_file_path, "wb") as f:
-                                        f.write(include_response.content)
-                                else:
-                                    print(f"Failed to download included file: {include_path}")
+                                with session.get(include_url, stream=True) as include_response:
+                                    if include_response.status_code == 200:
+                                        with open(include_file_path, "wb") as f:
+                                            _copy_response(include_response, f)
+                                    else:
+                                        logger.warning("Failed to download included file: %s", include_path)
 
                         # Import the model into Blender
-                        if file_format == "gltf" or file_format == "glb":
-                            bpy.ops.import_scene.gltf(filepath=main_file_path)
-                        elif file_format == "fbx":
-                            bpy.ops.import_scene.fbx(filepath=main_file_path)
-                        elif file_format == "obj":
-                            bpy.ops.import_scene.obj(filepath=main_file_path)
-                        elif file_format == "blend":
-                            # For blend files, we need to append or link
-                            with bpy.data.libraries.load(main_file_path, link=False) as (data_from, data_to):
-                                data_to.objects = data_from.objects
-
-                            # Link the objects to the scene
-                            for obj in data_to.objects:
-                                if obj is not None:
-                                    bpy.context.collection.objects.link(obj)
-                        else:
+                        importer = _MODEL_IMPORTERS.get(file_format)
+                        if importer is None:
                             return {"error": f"Unsupported model format: {file_format}"}
+                        importer(main_file_path)
 
                         # Get the names of imported objects
                         imported_objects = [obj.name for obj in bpy.context.selected_objects]
@@ -939,38 +1466,38 @@ class BlenderMCPServer:
 
             # Find all images related to this texture and ensure they're properly loaded
             texture_images = {}
-            for img in bpy.data.images:
-                if img.name.startswith(texture_id + "_"):
-                    # Extract the map type from the image name
-                    map_type = img.name.split('_')[-1].split('.')[0]
-
-                    # Force a reload of the image
+            candidates = [
+                img for img in map(bpy.data.images.get, _polyhaven_texture_index.get(texture_id, ()))
+                if img is not None
+            ]
+            if not candidates:
+                # Not downloaded in this session: fall back to matching by name
+                prefix = texture_id + "_"
+                candidates = [img for img in bpy.data.images if img.name.startswith(prefix)]
+
+            for img in candidates:
+                # Extract the map type from the image name
+                map_type = img.name.rpartition('_')[2].partition('.')[0]
+
+                # Packed images are already in memory; only reload and pack
+                # ones still backed by a file on disk
+                if not img.packed_file:
                     img.reload()
+                    img.pack()
 
-                    # Ensure proper color space
-                    if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                        try:
-                            img.colorspace_settings.name = 'sRGB'
-                        except:
-                            pass
-                    else:
-                        try:
-                            img.colorspace_settings.name = 'Non-Color'
-                        except:
-                            pass
-
-                    # Ensure the image is packed
-                    if not img.packed_file:
-                        img.pack()
-
-                    texture_images[map_type] = img
-                    print(f"Loaded texture map: {map_type} - {img.name}")
-
-                    # Debug info
-                    print(f"Image size: {img.size[0]}x{img.size[1]}")
-                    print(f"Color space: {img.colorspace_settings.name}")
-                    print(f"File format: {img.file_format}")
-                    print(f"Is packed: {bool(img.packed_file)}")
+                # Ensure proper color space
+                if _MAP_KIND.get(map_type.lower()) == "base":
+                    _set_colorspace(img, _COLOR_COLORSPACES)
+                else:
+                    _set_colorspace(img, _DATA_COLORSPACES)
+
+                texture_images[map_type] = img
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Loaded texture map: %s - %s (%dx%d, %s, %s, packed=%s)",
+                        map_type, img.name, img.size[0], img.size[1],
+                        img.colorspace_settings.name, img.file_format, bool(img.packed_file),
+                    )
 
             if not texture_images:
                 return {"error": f"No texture images found for: {texture_id}. Please download the texture first."}
@@ -978,19 +1505,17 @@ class BlenderMCPServer:
             # Create a new material
             new_mat_name = f"{texture_id}_material_{object_name}"
 
-            # Remove any existing material with this name to avoid conflicts
-            existing_mat = bpy.data.materials.get(new_mat_name)
-            if existing_mat:
-                bpy.data.materials.remove(existing_mat)
-
-            new_mat = bpy.data.materials.new(name=new_mat_name)
+            # Rebuild an existing material with this name in place rather than
+            # removing it and allocating a new datablock
+            new_mat = bpy.data.materials.get(new_mat_name) or bpy.data.materials.new(name=new_mat_name)
             new_mat.use_nodes = True
 
             # Set up the material nodes
             nodes = new_mat.node_tree.nodes
             links = new_mat.node_tree.links
 
-            # Clear default nodes
+            # Clear default or previously built nodes
+            links.clear()
             nodes.clear()
 
             # Create output node
@@ -1000,7 +1525,11 @@ class BlenderMCPServer:
             # Create principled BSDF node
             principled = nodes.new(type='ShaderNodeBsdfPrincipled')
             principled.location = (300, 0)
-            links.new(principled.outputs[0], output.inputs[0])
+            # Links are queued by input socket and created together once all
+            # nodes exist; a later entry for the same input replaces the
+            # earlier one, as links.new would
+            pending_links = {}
+            pending_links[output.inputs[0]] = principled.outputs[0]
 
             # Add texture nodes based on available maps
             tex_coord = nodes.new(type='ShaderNodeTexCoord')
@@ -1009,109 +1538,46 @@ class BlenderMCPServer:
             mapping = nodes.new(type='ShaderNodeMapping')
             mapping.location = (-600, 0)
             mapping.vector_type = 'TEXTURE'  # Changed from default 'POINT' to 'TEXTURE'
-            links.new(tex_coord.outputs['UV'], mapping.inputs['Vector'])
+            pending_links[mapping.inputs['Vector']] = tex_coord.outputs['UV']
 
             # Position offset for texture nodes
             x_pos = -400
             y_pos = 300
 
             # Connect different texture maps
+            texture_nodes = {}
             for map_type, image in texture_images.items():
                 tex_node = nodes.new(type='ShaderNodeTexImage')
                 tex_node.location = (x_pos, y_pos)
                 tex_node.image = image
+                texture_nodes[map_type] = tex_node
 
-                # Set color space based on map type
-                if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                    try:
-                        tex_node.image.colorspace_settings.name = 'sRGB'
-                    except:
-                        pass  # Use default if sRGB not available
-                else:
-                    try:
-                        tex_node.image.colorspace_settings.name = 'Non-Color'
-                    except:
-                        pass  # Use default if Non-Color not available
-
-                links.new(mapping.outputs['Vector'], tex_node.inputs['Vector'])
+                pending_links[tex_node.inputs['Vector']] = mapping.outputs['Vector']
 
                 # Connect to appropriate input on Principled BSDF
-                if map_type.lower() in ['color', 'diffuse', 'albedo']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Base Color'])
-                elif map_type.lower() in ['roughness', 'rough']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Roughness'])
-                elif map_type.lower() in ['metallic', 'metalness', 'metal']:
-                    links.new(tex_node.outputs['Color'], principled.inputs['Metallic'])
-                elif map_type.lower() in ['normal', 'nor', 'dx', 'gl']:
-                    # Add normal map node
-                    normal_map = nodes.new(type='ShaderNodeNormalMap')
-                    normal_map.location = (x_pos + 200, y_pos)
-                    links.new(tex_node.outputs['Color'], normal_map.inputs['Color'])
-                    links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
-                elif map_type.lower() in ['displacement', 'disp', 'height']:
-                    # Add displacement node
-                    disp_node = nodes.new(type='ShaderNodeDisplacement')
-                    disp_node.location = (x_pos + 200, y_pos - 200)
-                    disp_node.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
-                    links.new(tex_node.outputs['Color'], disp_node.inputs['Height'])
-                    links.new(disp_node.outputs['Displacement'], output.inputs['Displacement'])
+                match _MAP_KIND.get(map_type.lower()):
+                    case "base":
+                        pending_links[principled.inputs['Base Color']] = tex_node.outputs['Color']
+                    case "rough":
+                        pending_links[principled.inputs['Roughness']] = tex_node.outputs['Color']
+                    case "metal":
+                        pending_links[principled.inputs['Metallic']] = tex_node.outputs['Color']
+                    case "normal":
+                        # Add normal map node
+                        normal_map = nodes.new(type='ShaderNodeNormalMap')
+                        normal_map.location = (x_pos + 200, y_pos)
+                        pending_links[normal_map.inputs['Color']] = tex_node.outputs['Color']
+                        pending_links[principled.inputs['Normal']] = normal_map.outputs['Normal']
+                    case "disp":
+                        # Add displacement node
+                        disp_node = nodes.new(type='ShaderNodeDisplacement')
+                        disp_node.location = (x_pos + 200, y_pos - 200)
+                        disp_node.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
+                        pending_links[disp_node.inputs['Height']] = tex_node.outputs['Color']
+                        pending_links[output.inputs['Displacement']] = disp_node.outputs['Displacement']
 
                 y_pos -= 250
 
-            # Second pass: Connect nodes with proper handling for special cases
-            texture_nodes = {}
-
-            # First find all texture nodes and store them by map type
-            for node in nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    for map_type, image in texture_images.items():
-                        if node.image == image:
-                            texture_nodes[map_type] = node
-                            break
-
-            # Now connect everything using the nodes instead of images
-            # Handle base color (diffuse)
-            for map_name in ['color', 'diffuse', 'albedo']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Base Color'])
-                    print(f"Connected {map_name} to Base Color")
-                    break
-
-            # Handle roughness
-            for map_name in ['roughness', 'rough']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Roughness'])
-                    print(f"Connected {map_name} to Roughness")
-                    break
-
-            # Handle metallic
-            for map_name in ['metallic', 'metalness', 'metal']:
-                if map_name in texture_nodes:
-                    links.new(texture_nodes[map_name].outputs['Color'], principled.inputs['Metallic'])
-                    print(f"Connected {map_name} to Metallic")
-                    break
-
-            # Handle normal maps
-            for map_name in ['gl', 'dx', 'nor']:
-                if map_name in texture_nodes:
-                    normal_map_node = nodes.new(type='ShaderNodeNormalMap')
-                    normal_map_node.location = (100, 100)
-                    links.new(texture_nodes[map_name].outputs['Color'], normal_map_node.inputs['Color'])
-                    links.new(normal_map_node.outputs['Normal'], principled.inputs['Normal'])
-                    print(f"Connected {map_name} to Normal")
-                    break
-
-            # Handle displacement
-            for map_name in ['displacement', 'disp', 'height']:
-                if map_name in texture_nodes:
-                    disp_node = nodes.new(type='ShaderNodeDisplacement')
-                    disp_node.location = (300, -200)
-                    disp_node.inputs['Scale'].default_value = 0.1  # Reduce displacement strength
-                    links.new(texture_nodes[map_name].outputs['Color'], disp_node.inputs['Height'])
-                    links.new(disp_node.outputs['Displacement'], output.inputs['Displacement'])
-                    print(f"Connected {map_name} to Displacement")
-                    break
-
             # Handle ARM texture (Ambient Occlusion, Roughness, Metallic)
             if 'arm' in texture_nodes:
                 # Blender 4.0 removed ShaderNodeSeparateRGB (renamed to
@@ -1124,17 +1590,17 @@ class BlenderMCPServer:
                     sep = nodes.new(type='ShaderNodeSeparateRGB')
                     in_socket, ch_r, ch_g, ch_b = 'Image', 'R', 'G', 'B'
                 sep.location = (-200, -100)
-                links.new(texture_nodes['arm'].outputs['Color'], sep.inputs[in_socket])
+                pending_links[sep.inputs[in_socket]] = texture_nodes['arm'].outputs['Color']
 
                 # Connect Roughness (G) if no dedicated roughness map
                 if not any(map_name in texture_nodes for map_name in ['roughness', 'rough']):
-                    links.new(sep.outputs[ch_g], principled.inputs['Roughness'])
-                    print("Connected ARM.G to Roughness")
+                    pending_links[principled.inputs['Roughness']] = sep.outputs[ch_g]
+                    logger.debug("Connected ARM.G to Roughness")
 
                 # Connect Metallic (B) if no dedicated metallic map
                 if not any(map_name in texture_nodes for map_name in ['metallic', 'metalness', 'metal']):
-                    links.new(sep.outputs[ch_b], principled.inputs['Metallic'])
-                    print("Connected ARM.B to Metallic")
+                    pending_links[principled.inputs['Metallic']] = sep.outputs[ch_b]
+                    logger.debug("Connected ARM.B to Metallic")
 
                 # For AO (R channel), multiply with base color if we have one
                 base_color_node = None
@@ -1149,16 +1615,12 @@ class BlenderMCPServer:
                     mix_node.blend_type = 'MULTIPLY'
                     mix_node.inputs['Fac'].default_value = 0.8  # 80% influence
 
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs['Color'].links:
-                        if link.to_socket == principled.inputs['Base Color']:
-                            links.remove(link)
-
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs['Color'], mix_node.inputs[1])
-                    links.new(sep.outputs[ch_r], mix_node.inputs[2])
-                    links.new(mix_node.outputs['Color'], principled.inputs['Base Color'])
-                    print("Connected ARM.R to AO mix with Base Color")
+                    # Connect through the mix node, replacing the direct
+                    # base color link queued above
+                    pending_links[mix_node.inputs[1]] = base_color_node.outputs['Color']
+                    pending_links[mix_node.inputs[2]] = sep.outputs[ch_r]
+                    pending_links[principled.inputs['Base Color']] = mix_node.outputs['Color']
+                    logger.debug("Connected ARM.R to AO mix with Base Color")
 
             # Handle AO (Ambient Occlusion) if separate
             if 'ao' in texture_nodes:
@@ -1174,20 +1636,18 @@ class BlenderMCPServer:
                     mix_node.blend_type = 'MULTIPLY'
                     mix_node.inputs['Fac'].default_value = 0.8  # 80% influence
 
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs['Color'].links:
-                        if link.to_socket == principled.inputs['Base Color']:
-                            links.remove(link)
+                    # Connect through the mix node, replacing the direct
+                    # base color link queued above
+                    pending_links[mix_node.inputs[1]] = base_color_node.outputs['Color']
+                    pending_links[mix_node.inputs[2]] = texture_nodes['ao'].outputs['Color']
+                    pending_links[principled.inputs['Base Color']] = mix_node.outputs['Color']
+                    logger.debug("Connected AO to mix with Base Color")
 
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs['Color'], mix_node.inputs[1])
-                    links.new(texture_nodes['ao'].outputs['Color'], mix_node.inputs[2])
-                    links.new(mix_node.outputs['Color'], principled.inputs['Base Color'])
-                    print("Connected AO to mix with Base Color")
+            for to_socket, from_socket in pending_links.items():
+                links.new(from_socket, to_socket)
 
             # CRITICAL: Make sure to clear all existing materials from the object
-            while len(obj.data.materials) > 0:
-                obj.data.materials.pop(index=0)
+            obj.data.materials.clear()
 
             # Assign the new material to the object
             obj.data.materials.append(new_mat)
@@ -1202,27 +1662,29 @@ class BlenderMCPServer:
             # Get the list of texture maps
             texture_maps = list(texture_images.keys())
 
-            # Get info about texture nodes for debugging
+            # Get info about texture nodes for debugging. Links are indexed in
+            # one pass; each socket's .links would walk the whole tree again.
+            link_index = {}
+            for link in new_mat.node_tree.links:
+                link_index.setdefault(link.from_node.name, []).append(
+                    f"{link.from_socket.name} → {link.to_node.name}.{link.to_socket.name}"
+                )
+
             material_info = {
                 "name": new_mat.name,
                 "has_nodes": new_mat.use_nodes,
                 "node_count": len(new_mat.node_tree.nodes),
-                "texture_nodes": []
-            }
-
-            for node in new_mat.node_tree.nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    connections = []
-                    for output in node.outputs:
-                        for link in output.links:
-                            connections.append(f"{output.name} → {link.to_node.name}.{link.to_socket.name}")
-
-                    material_info["texture_nodes"].append({
+                "texture_nodes": [
+                    {
                         "name": node.name,
                         "image": node.image.name,
                         "colorspace": node.image.colorspace_settings.name,
-                        "connections": connections
-                    })
+                        "connections": link_index.get(node.name, [])
+                    }
+                    for node in new_mat.node_tree.nodes
+                    if node.type == 'TEX_IMAGE' and node.image
+                ]
+            }
 
             return {
                 "success": True,
@@ -1233,8 +1695,7 @@ class BlenderMCPServer:
             }
 
         except Exception as e:
-            print(f"Error in set_texture: {str(e)}")
-            traceback.print_exc()
+            _log_exception("Error in set_texture", e)
             return {"error": f"Failed to apply texture: {str(e)}"}
 
     def get_telemetry_consent(self):
@@ -1269,8 +1730,9 @@ class BlenderMCPServer:
     #region Hyper3D
     def get_hyper3d_status(self):
         """Get the current status of Hyper3D Rodin integration"""
-        enabled = bpy.context.scene.blendermcp_use_hyper3d
-        hyper3d_api_key = self._get_hyper3d_api_key()
+        scene = bpy.context.scene
+        enabled = scene.blendermcp_use_hyper3d
+        hyper3d_api_key = self._get_hyper3d_api_key(scene)
         if enabled:
             if not hyper3d_api_key:
                 return {
@@ -1281,7 +1743,7 @@ class BlenderMCPServer:
                                 3. Choose the right plaform and fill in the API Key
                                 4. Restart the connection to Claude"""
                 }
-            mode = bpy.context.scene.blendermcp_hyper3d_mode
+            mode = scene.blendermcp_hyper3d_mode
             message = f"Hyper3D Rodin integration is enabled and ready to use. Mode: {mode}. " + \
                 f"Key type: {'private' if hyper3d_api_key != RODIN_FREE_TRIAL_KEY else 'free_trial'}"
             return {
@@ -1312,6 +1774,7 @@ class BlenderMCPServer:
             images: list[tuple[str, str]]=None,
             bbox_condition=None
         ):
+        session = _get_http_session()
         try:
             api_key = self._get_hyper3d_api_key()
             if not api_key:
@@ -1320,21 +1783,25 @@ class BlenderMCPServer:
                 images = []
             """Call Rodin API, get the job uuid and subscription key"""
             files = [
-                *[("images", (f"{i:04d}{img_suffix}", base64.b64decode(img) if isinstance(img, str) else img)) for i, (img_suffix, img) in enumerate(images)],
+                ("images", (f"{i:04d}{img_suffix}", base64.b64decode(img) if isinstance(img, str) else img))
+                for i, (img_suffix, img) in enumerate(images)
+            ]
+            files.extend((
                 ("tier", (None, "Sketch")),
                 ("mesh_mode", (None, "Raw")),
                 ("texture_mode", (None, "high")),
-            ]
+            ))
             if text_prompt:
                 files.append(("prompt", (None, text_prompt)))
             if bbox_condition:
                 files.append(("bbox_condition", (None, json.dumps(bbox_condition))))
-            response = requests.post(
+            response = session.post(
                 "https://hyperhuman.deemos.com/api/v2/rodin",
                 headers={
                     "Authorization": f"Bearer {api_key}",
                 },
-                files=files
+                files=files,
+                timeout=HYPER3D_TIMEOUT,
             )
             data = response.json()
             return data
@@ -1347,6 +1814,7 @@ class BlenderMCPServer:
             images: list[tuple[str, str]]=None,
             bbox_condition=None
         ):
+        session = _get_http_session()
         try:
             api_key = self._get_hyper3d_api_key()
             if not api_key:
@@ -1360,13 +1828,14 @@ class BlenderMCPServer:
                 req_data["prompt"] = text_prompt
             if bbox_condition:
                 req_data["bbox_condition"] = bbox_condition
-            response = requests.post(
+            response = session.post(
                 "https://queue.fal.run/fal-ai/hyper3d/rodin",
                 headers={
                     "Authorization": f"Key {api_key}",
                     "Content-Type": "application/json",
                 },
-                json=req_data
+                json=req_data,
+                timeout=HYPER3D_TIMEOUT,
             )
             data = response.json()
             return data
@@ -1384,10 +1853,11 @@ class BlenderMCPServer:
 
     def poll_rodin_job_status_main_site(self, subscription_key: str):
         """Call the job status API to get the job status"""
+        session = _get_http_session()
         api_key = self._get_hyper3d_api_key()
         if not api_key:
             return {"error": "Hyper3D API key is not given"}
-        response = requests.post(
+        response = session.post(
             "https://hyperhuman.deemos.com/api/v2/status",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -1395,6 +1865,7 @@ class BlenderMCPServer:
             json={
                 "subscription_key": subscription_key,
             },
+            timeout=HYPER3D_TIMEOUT,
         )
         data = response.json()
         return {
@@ -1403,22 +1874,25 @@ class BlenderMCPServer:
 
     def poll_rodin_job_status_fal_ai(self, request_id: str):
         """Call the job status API to get the job status"""
+        session = _get_http_session()
         api_key = self._get_hyper3d_api_key()
         if not api_key:
             return {"error": "Hyper3D API key is not given"}
-        response = requests.get(
+        response = session.get(
             f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
             headers={
                 "Authorization": f"KEY {api_key}",
             },
+            timeout=HYPER3D_TIMEOUT,
         )
         data = response.json()
         return data
 
     @staticmethod
     def _clean_imported_glb(filepath, mesh_name=None):
-        # Get the set of existing objects before import
-        existing_objects = set(bpy.data.objects)
+        # Snapshot existing objects by name; RNA references taken before the
+        # import are not guaranteed to stay valid across it
+        existing_names = {o.name_full for o in bpy.data.objects}
 
         # Import the GLB file
         bpy.ops.import_scene.gltf(filepath=filepath)
@@ -1427,11 +1901,11 @@ class BlenderMCPServer:
         bpy.context.view_layer.update()
 
         # Get all imported objects
-        imported_objects = list(set(bpy.data.objects) - existing_objects)
+        imported_objects = [o for o in bpy.data.objects if o.name_full not in existing_names]
         # imported_objects = [obj for obj in bpy.context.view_layer.objects if obj.select_get()]
 
         if not imported_objects:
-            print("Error: No objects were imported.")
+            logger.warning("Error: No objects were imported.")
             return
 
         # Identify the mesh object
@@ -1439,35 +1913,35 @@ class BlenderMCPServer:
 
         if len(imported_objects) == 1 and imported_objects[0].type == 'MESH':
             mesh_obj = imported_objects[0]
-            print("Single mesh imported, no cleanup needed.")
+            logger.debug("Single mesh imported, no cleanup needed.")
         else:
             if len(imported_objects) == 2:
                 empty_objs = [i for i in imported_objects if i.type == "EMPTY"]
                 if len(empty_objs) != 1:
-                    print("Error: Expected an empty node with one mesh child or a single mesh object.")
+                    logger.warning("Error: Expected an empty node with one mesh child or a single mesh object.")
                     return
                 parent_obj = empty_objs.pop()
                 if len(parent_obj.children) == 1:
                     potential_mesh = parent_obj.children[0]
                     if potential_mesh.type == 'MESH':
-                        print("GLB structure confirmed: Empty node with one mesh child.")
+                        logger.debug("GLB structure confirmed: Empty node with one mesh child.")
 
                         # Unparent the mesh from the empty node
                         potential_mesh.parent = None
 
                         # Remove the empty node
                         bpy.data.objects.remove(parent_obj)
-                        print("Removed empty node, keeping only the mesh.")
+                        logger.debug("Removed empty node, keeping only the mesh.")
 
                         mesh_obj = potential_mesh
                     else:
-                        print("Error: Child is not a mesh object.")
+                        logger.warning("Error: Child is not a mesh object.")
                         return
                 else:
-                    print("Error: Expected an empty node with one mesh child or a single mesh object.")
+                    logger.warning("Error: Expected an empty node with one mesh child or a single mesh object.")
                     return
             else:
-                print("Error: Expected an empty node with one mesh child or a single mesh object.")
+                logger.warning("Error: Expected an empty node with one mesh child or a single mesh object.")
                 return
 
         # Rename the mesh if needed
@@ -1476,9 +1950,9 @@ class BlenderMCPServer:
                 mesh_obj.name = mesh_name
                 if mesh_obj.data.name is not None:
                     mesh_obj.data.name = mesh_name
-                print(f"Mesh renamed to: {mesh_name}")
+                logger.debug("Mesh renamed to: %s", mesh_name)
         except Exception as e:
-            print("Having issue with renaming, give up renaming.")
+            logger.warning("Having issue with renaming, give up renaming.")
 
         return mesh_obj
 
@@ -1493,131 +1967,90 @@ class BlenderMCPServer:
 
     def import_generated_asset_main_site(self, task_uuid: str, name: str):
         """Fetch the generated asset, import into blender"""
+        session = _get_http_session()
         api_key = self._get_hyper3d_api_key()
         if not api_key:
             return {"succeed": False, "error": "Hyper3D API key is not given"}
-        response = requests.post(
+        response = session.post(
             "https://hyperhuman.deemos.com/api/v2/download",
             headers={
                 "Authorization": f"Bearer {api_key}",
             },
             json={
                 'task_uuid': task_uuid
-            }
+            },
+            timeout=HYPER3D_TIMEOUT,
         )
         data_ = response.json()
-        temp_file = None
-        for i in data_["list"]:
-            if i["name"].endswith(".glb"):
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False,
-                    prefix=task_uuid,
-                    suffix=".glb",
-                )
-
-                try:
-                    # Download the content
-                    response = requests.get(i["url"], stream=True)
-                    response.raise_for_status()  # Raise an exception for HTTP errors
+        glb = next((i for i in data_["list"] if i["name"].endswith(".glb")), None)
+        if glb is None:
+            return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
 
-                    # Write the content to the temporary file
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)
+        temp_path = os.path.join(_get_temp_dir(), f"{os.path.basename(task_uuid)}.glb")
 
-                    # Close the file
-                    temp_file.close()
+        try:
+            # Download the content
+            with session.get(glb["url"], stream=True) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
 
-                except Exception as e:
-                    # Clean up the file if there's an error
-                    temp_file.close()
-                    os.unlink(temp_file.name)
-                    return {"succeed": False, "error": str(e)}
+                # Stream the content straight into the temporary file
+                with open(temp_path, "wb") as temp_file:
+                    _copy_response(response, temp_file, MAX_GLB_BYTES)
 
-                break
-        else:
-            return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
+        except Exception as e:
+            # Clean up the file if there's an error
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            return {"succeed": False, "error": str(e)}
 
         try:
             obj = self._clean_imported_glb(
-                filepath=temp_file.name,
+                filepath=temp_path,
                 mesh_name=name
             )
-            result = {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-            }
-
-            if obj.type == "MESH":
-                bounding_box = self._get_aabb(obj)
-                result["world_bounding_box"] = bounding_box
-
-            return {
-                "succeed": True, **result
-            }
+            return {"succeed": True, **self._obj_to_result(obj)}
         except Exception as e:
             return {"succeed": False, "error": str(e)}
 
     def import_generated_asset_fal_ai(self, request_id: str, name: str):
         """Fetch the generated asset, import into blender"""
+        session = _get_http_session()
         api_key = self._get_hyper3d_api_key()
         if not api_key:
             return {"succeed": False, "error": "Hyper3D API key is not given"}
-        response = requests.get(
+        response = session.get(
             f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}",
             headers={
                 "Authorization": f"Key {api_key}",
-            }
+            },
+            timeout=HYPER3D_TIMEOUT,
         )
         data_ = response.json()
-        temp_file = None
 
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            prefix=request_id,
-            suffix=".glb",
-        )
+        temp_path = os.path.join(_get_temp_dir(), f"{os.path.basename(request_id)}.glb")
 
         try:
-            # Download the content
-            response = requests.get(data_["model_mesh"]["url"], stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
+            # Download the content; leaving the block returns the
+            # connection to the session's pool
+            with session.get(data_["model_mesh"]["url"], stream=True) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
 
-            # Write the content to the temporary file
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_file.write(chunk)
-
-            # Close the file
-            temp_file.close()
+                # Stream the content straight into the temporary file
+                with open(temp_path, "wb") as temp_file:
+                    _copy_response(response, temp_file, MAX_GLB_BYTES)
 
         except Exception as e:
             # Clean up the file if there's an error
-            temp_file.close()
-            os.unlink(temp_file.name)
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
             return {"succeed": False, "error": str(e)}
 
         try:
             obj = self._clean_imported_glb(
-                filepath=temp_file.name,
+                filepath=temp_path,
                 mesh_name=name
             )
-            result = {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-            }
-
-            if obj.type == "MESH":
-                bounding_box = self._get_aabb(obj)
-                result["world_bounding_box"] = bounding_box
-
-            return {
-                "succeed": True, **result
-            }
+            return {"succeed": True, **self._obj_to_result(obj)}
         except Exception as e:
             return {"succeed": False, "error": str(e)}
     #endregion
@@ -1625,6 +2058,8 @@ class BlenderMCPServer:
     #region Sketchfab API
     def get_sketchfab_status(self):
         """Get the current status of Sketchfab integration"""
+        import requests
+        session = _get_http_session()
         enabled = bpy.context.scene.blendermcp_use_sketchfab
         api_key = self._get_sketchfab_api_key()
 
@@ -1635,7 +2070,7 @@ class BlenderMCPServer:
                     "Authorization": f"Token {api_key}"
                 }
 
-                response = requests.get(
+                response = session.get(
                     "https://api.sketchfab.com/v3/me",
                     headers=headers,
                     timeout=30  # Add timeout of 30 seconds
@@ -1687,6 +2122,8 @@ class BlenderMCPServer:
 
     def search_sketchfab_models(self, query, categories=None, count=20, downloadable=True):
         """Search for models on Sketchfab based on query and optional filters"""
+        import requests
+        session = _get_http_session()
         try:
             api_key = self._get_sketchfab_api_key()
             if not api_key:
@@ -1712,7 +2149,7 @@ class BlenderMCPServer:
 
 
             # Use the search endpoint as specified in the API documentation
-            response = requests.get(
+            response = session.get(
                 "https://api.sketchfab.com/v3/search",
                 headers=headers,
                 params=params,
@@ -1743,12 +2180,13 @@ class BlenderMCPServer:
         except json.JSONDecodeError as e:
             return {"error": f"Invalid JSON response from Sketchfab API: {str(e)}"}
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            _log_exception("Error searching Sketchfab", e)
             return {"error": str(e)}
 
     def get_sketchfab_model_preview(self, uid):
         """Get thumbnail preview image of a Sketchfab model by its UID"""
+        import requests
+        session = _get_http_session()
         try:
             import base64
             
@@ -1759,7 +2197,7 @@ class BlenderMCPServer:
             headers = {"Authorization": f"Token {api_key}"}
             
             # Get model info which includes thumbnails
-            response = requests.get(
+            response = session.get(
                 f"https://api.sketchfab.com/v3/models/{uid}",
                 headers=headers,
                 timeout=30
@@ -1797,7 +2235,7 @@ class BlenderMCPServer:
                 return {"error": "Thumbnail URL not found"}
             
             # Download the thumbnail image
-            img_response = requests.get(thumbnail_url, timeout=30)
+            img_response = session.get(thumbnail_url, timeout=30)
             if img_response.status_code != 200:
                 return {"error": f"Failed to download thumbnail: {img_response.status_code}"}
             
@@ -1829,8 +2267,7 @@ class BlenderMCPServer:
         except requests.exceptions.Timeout:
             return {"error": "Request timed out. Check your internet connection."}
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            _log_exception("Error getting Sketchfab model preview", e)
             return {"error": f"Failed to get model preview: {str(e)}"}
 
     def download_sketchfab_model(self, uid, normalize_size=False, target_size=1.0):
@@ -1841,6 +2278,8 @@ class BlenderMCPServer:
         - normalize_size: If True, scale the model so its largest dimension equals target_size
         - target_size: The target size in Blender units (meters) for the largest dimension
         """
+        import requests
+        session = _get_http_session()
         try:
             api_key = self._get_sketchfab_api_key()
             if not api_key:
@@ -1854,7 +2293,7 @@ class BlenderMCPServer:
             # Request download URL using the exact endpoint from the documentation
             download_endpoint = f"https://api.sketchfab.com/v3/models/{uid}/download"
 
-            response = requests.get(
+            response = session.get(
                 download_endpoint,
                 headers=headers,
                 timeout=30  # Add timeout of 30 seconds
@@ -1882,7 +2321,7 @@ class BlenderMCPServer:
                 return {"error": "No download URL available for this model. Make sure the model is downloadable and you have access."}
 
             # Download the model (already has timeout)
-            model_response = requests.get(download_url, timeout=60)  # 60 second timeout
+            model_response = session.get(download_url, timeout=60)  # 60 second timeout
 
             if model_response.status_code != 200:
                 return {"error": f"Model download failed with status code {model_response.status_code}"}
@@ -1965,26 +2404,10 @@ class BlenderMCPServer:
             
             if all_meshes:
                 # Calculate combined world bounding box for all meshes
-                all_min = mathutils.Vector((float('inf'), float('inf'), float('inf')))
-                all_max = mathutils.Vector((float('-inf'), float('-inf'), float('-inf')))
-                
-                for mesh_obj in all_meshes:
-                    # Get world-space bounding box corners
-                    for corner in mesh_obj.bound_box:
-                        world_corner = mesh_obj.matrix_world @ mathutils.Vector(corner)
-                        all_min.x = min(all_min.x, world_corner.x)
-                        all_min.y = min(all_min.y, world_corner.y)
-                        all_min.z = min(all_min.z, world_corner.z)
-                        all_max.x = max(all_max.x, world_corner.x)
-                        all_max.y = max(all_max.y, world_corner.y)
-                        all_max.z = max(all_max.z, world_corner.z)
+                all_min, all_max = self._get_combined_aabb(all_meshes)
                 
                 # Calculate dimensions
-                dimensions = [
-                    all_max.x - all_min.x,
-                    all_max.y - all_min.y,
-                    all_max.z - all_min.z
-                ]
+                dimensions = [hi - lo for lo, hi in zip(all_min, all_max)]
                 max_dimension = max(dimensions)
                 
                 # Apply normalization if requested
@@ -2006,26 +2429,10 @@ class BlenderMCPServer:
                     bpy.context.view_layer.update()
                     
                     # Recalculate bounding box after scaling
-                    all_min = mathutils.Vector((float('inf'), float('inf'), float('inf')))
-                    all_max = mathutils.Vector((float('-inf'), float('-inf'), float('-inf')))
-                    
-                    for mesh_obj in all_meshes:
-                        for corner in mesh_obj.bound_box:
-                            world_corner = mesh_obj.matrix_world @ mathutils.Vector(corner)
-                            all_min.x = min(all_min.x, world_corner.x)
-                            all_min.y = min(all_min.y, world_corner.y)
-                            all_min.z = min(all_min.z, world_corner.z)
-                            all_max.x = max(all_max.x, world_corner.x)
-                            all_max.y = max(all_max.y, world_corner.y)
-                            all_max.z = max(all_max.z, world_corner.z)
-                    
-                    dimensions = [
-                        all_max.x - all_min.x,
-                        all_max.y - all_min.y,
-                        all_max.z - all_min.z
-                    ]
+                    all_min, all_max = self._get_combined_aabb(all_meshes)
+                    dimensions = [hi - lo for lo, hi in zip(all_min, all_max)]
                 
-                world_bounding_box = [[all_min.x, all_min.y, all_min.z], [all_max.x, all_max.y, all_max.z]]
+                world_bounding_box = [all_min, all_max]
             else:
                 world_bounding_box = None
                 dimensions = None
@@ -2052,16 +2459,16 @@ class BlenderMCPServer:
         except json.JSONDecodeError as e:
             return {"error": f"Invalid JSON response from Sketchfab API: {str(e)}"}
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            _log_exception("Error downloading Sketchfab model", e)
             return {"error": f"Failed to download model: {str(e)}"}
     #endregion
 
     #region Hunyuan3D
     def get_hunyuan3d_status(self):
         """Get the current status of Hunyuan3D integration"""
-        enabled = bpy.context.scene.blendermcp_use_hunyuan3d
-        hunyuan3d_mode = bpy.context.scene.blendermcp_hunyuan3d_mode
+        scene = bpy.context.scene
+        enabled = scene.blendermcp_use_hunyuan3d
+        hunyuan3d_mode = scene.blendermcp_hunyuan3d_mode
         secret_id = self._get_hunyuan3d_secret_id()
         secret_key = self._get_hunyuan3d_secret_key()
         api_url = self._get_hunyuan3d_api_url()
@@ -2202,6 +2609,7 @@ class BlenderMCPServer:
         text_prompt: str = None,
         image: str = None
     ):
+        session = _get_http_session()
         try:
             secret_id = self._get_hunyuan3d_secret_id()
             secret_key = self._get_hunyuan3d_secret_key()
@@ -2253,7 +2661,7 @@ class BlenderMCPServer:
             # Get signed headers
             headers, endpoint = self.get_tencent_cloud_sign_headers("POST", "/", headParams, data, service, region, secret_id, secret_key)
 
-            response = requests.post(
+            response = session.post(
                 endpoint,
                 headers = headers,
                 data = json.dumps(data)
@@ -2271,12 +2679,14 @@ class BlenderMCPServer:
         self,
         text_prompt: str = None,
         image: str = None):
+        session = _get_http_session()
         try:
             base_url = self._get_hunyuan3d_api_url().rstrip('/')
-            octree_resolution = bpy.context.scene.blendermcp_hunyuan3d_octree_resolution
-            num_inference_steps = bpy.context.scene.blendermcp_hunyuan3d_num_inference_steps
-            guidance_scale = bpy.context.scene.blendermcp_hunyuan3d_guidance_scale
-            texture = bpy.context.scene.blendermcp_hunyuan3d_texture
+            scene = bpy.context.scene
+            octree_resolution = scene.blendermcp_hunyuan3d_octree_resolution
+            num_inference_steps = scene.blendermcp_hunyuan3d_num_inference_steps
+            guidance_scale = scene.blendermcp_hunyuan3d_guidance_scale
+            texture = scene.blendermcp_hunyuan3d_texture
 
             if not base_url:
                 return {"error": "API URL is not given"}
@@ -2300,7 +2710,7 @@ class BlenderMCPServer:
             if image:
                 if re.match(r'^https?://', image, re.IGNORECASE) is not None:
                     try:
-                        resImg = requests.get(image)
+                        resImg = session.get(image)
                         resImg.raise_for_status()
                         image_base64 = base64.b64encode(resImg.content).decode("ascii")
                         data["image"] = image_base64
@@ -2315,7 +2725,7 @@ class BlenderMCPServer:
                     except Exception as e:
                         return {"error": f"Image encoding failed: {str(e)}"}
 
-            response = requests.post(
+            response = session.post(
                 f"{base_url}/generate",
                 json = data,
             )
@@ -2326,14 +2736,14 @@ class BlenderMCPServer:
                 }
         
             # Decode base64 and save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".glb") as temp_file:
+            fd, temp_file_name = tempfile.mkstemp(suffix=".glb")
+            with os.fdopen(fd, "wb") as temp_file:
                 temp_file.write(response.content)
-                temp_file_name = temp_file.name
 
             # Import the GLB file in the main thread
             def import_handler():
                 bpy.ops.import_scene.gltf(filepath=temp_file_name)
-                os.unlink(temp_file.name)
+                os.unlink(temp_file_name)
                 return None
             
             bpy.app.timers.register(import_handler)
@@ -2343,7 +2753,7 @@ class BlenderMCPServer:
                 "message": "Generation and Import glb succeeded"
             }
         except Exception as e:
-            print(f"An error occurred: {e}")
+            _log_exception("Error in local Hunyuan3D job", e)
             return {"error": str(e)}
         
     
@@ -2352,7 +2762,8 @@ class BlenderMCPServer:
     
     def poll_hunyuan_job_status_ai(self, job_id: str):
         """Call the job status API to get the job status"""
-        print(job_id)
+        session = _get_http_session()
+        logger.debug("Polling Hunyuan3D job %s", job_id)
         try:
             secret_id = self._get_hunyuan3d_secret_id()
             secret_key = self._get_hunyuan3d_secret_key()
@@ -2380,7 +2791,7 @@ class BlenderMCPServer:
 
             headers, endpoint = self.get_tencent_cloud_sign_headers("POST", "/", headParams, data, service, region, secret_id, secret_key)
 
-            response = requests.post(
+            response = session.post(
                 endpoint,
                 headers=headers,
                 data=json.dumps(data)
@@ -2398,6 +2809,7 @@ class BlenderMCPServer:
         return self.import_generated_asset_hunyuan_ai(*args, **kwargs)
             
     def import_generated_asset_hunyuan_ai(self, name: str , zip_file_url: str):
+        session = _get_http_session()
         if not zip_file_url:
             return {"error": "Zip file not found"}
         
@@ -2413,7 +2825,7 @@ class BlenderMCPServer:
 
         try:
             # Download ZIP file
-            zip_response = requests.get(zip_file_url, stream=True)
+            zip_response = session.get(zip_file_url, stream=True)
             zip_response.raise_for_status()
             with open(zip_file_path, "wb") as f:
                 for chunk in zip_response.iter_content(chunk_size=8192):
@@ -2432,10 +2844,7 @@ class BlenderMCPServer:
                 return {"succeed": False, "error": "OBJ file not found after extraction"}
 
             # Import obj file
-            if bpy.app.version>=(4, 0, 0):
-                bpy.ops.wm.obj_import(filepath=obj_file_path)
-            else:
-                bpy.ops.import_scene.obj(filepath=obj_file_path)
+            _import_obj(obj_file_path)
 
             imported_objs = [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
             if not imported_objs:
@@ -2445,19 +2854,7 @@ class BlenderMCPServer:
             if name:
                 obj.name = name
 
-            result = {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-            }
-
-            if obj.type == "MESH":
-                bounding_box = self._get_aabb(obj)
-                result["world_bounding_box"] = bounding_box
-
-            return {"succeed": True, **result}
+            return {"succeed": True, **self._obj_to_result(obj)}
         except Exception as e:
             return {"succeed": False, "error": str(e)}
         finally:
@@ -2468,7 +2865,7 @@ class BlenderMCPServer:
                 if os.path.exists(obj_file_path):
                     os.remove(obj_file_path)
             except Exception as e:
-                print(f"Failed to clean up temporary directory {temp_dir}: {e}")
+                logger.warning("Failed to clean up temporary directory %s: %s", temp_dir, e)
     #endregion
 
 # Blender Addon Preferences
@@ -2688,40 +3085,35 @@ class BLENDERMCP_OT_OpenTerms(bpy.types.Operator):
         
         return {'FINISHED'}
 
-# Registration functions
-def register():
-    bpy.types.Scene.blendermcp_port = IntProperty(
+# Scene properties added by the add-on, registered and removed together
+_SCENE_PROPERTIES = (
+    ("blendermcp_port", IntProperty(
         name="Port",
         description="Port for the BlenderMCP server",
         default=9876,
         min=1024,
         max=65535
-    )
-
-    bpy.types.Scene.blendermcp_server_running = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_server_running", bpy.props.BoolProperty(
         name="Server Running",
         default=False
-    )
-
-    bpy.types.Scene.blendermcp_auto_start_server = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_auto_start_server", bpy.props.BoolProperty(
         name="Auto-Start Server",
         description="Automatically start the MCP server when Blender loads",
         default=True
-    )
-
-    bpy.types.Scene.blendermcp_use_polyhaven = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_use_polyhaven", bpy.props.BoolProperty(
         name="Use Poly Haven",
         description="Enable Poly Haven asset integration",
         default=False
-    )
-
-    bpy.types.Scene.blendermcp_use_hyper3d = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_use_hyper3d", bpy.props.BoolProperty(
         name="Use Hyper3D Rodin",
         description="Enable Hyper3D Rodin generatino integration",
         default=False
-    )
-
-    bpy.types.Scene.blendermcp_hyper3d_mode = bpy.props.EnumProperty(
+    )),
+    ("blendermcp_hyper3d_mode", bpy.props.EnumProperty(
         name="Rodin Mode",
         description="Choose the platform used to call Rodin APIs",
         items=[
@@ -2729,22 +3121,19 @@ def register():
             ("FAL_AI", "fal.ai", "fal.ai"),
         ],
         default="MAIN_SITE"
-    )
-
-    bpy.types.Scene.blendermcp_hyper3d_api_key = bpy.props.StringProperty(
+    )),
+    ("blendermcp_hyper3d_api_key", bpy.props.StringProperty(
         name="Hyper3D API Key",
         subtype="PASSWORD",
         description="API Key provided by Hyper3D",
         default=""
-    )
-
-    bpy.types.Scene.blendermcp_use_hunyuan3d = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_use_hunyuan3d", bpy.props.BoolProperty(
         name="Use Hunyuan 3D",
         description="Enable Hunyuan asset integration",
         default=False
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_mode = bpy.props.EnumProperty(
+    )),
+    ("blendermcp_hunyuan3d_mode", bpy.props.EnumProperty(
         name="Hunyuan3D Mode",
         description="Choose a local or official APIs",
         items=[
@@ -2752,78 +3141,82 @@ def register():
             ("OFFICIAL_API", "official api", "official api"),
         ],
         default="LOCAL_API"
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_secret_id = bpy.props.StringProperty(
+    )),
+    ("blendermcp_hunyuan3d_secret_id", bpy.props.StringProperty(
         name="Hunyuan 3D SecretId",
         description="SecretId provided by Hunyuan 3D",
         default=""
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_secret_key = bpy.props.StringProperty(
+    )),
+    ("blendermcp_hunyuan3d_secret_key", bpy.props.StringProperty(
         name="Hunyuan 3D SecretKey",
         subtype="PASSWORD",
         description="SecretKey provided by Hunyuan 3D",
         default=""
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_api_url = bpy.props.StringProperty(
+    )),
+    ("blendermcp_hunyuan3d_api_url", bpy.props.StringProperty(
         name="API URL",
         description="URL of the Hunyuan 3D API service",
         default="http://localhost:8081"
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_octree_resolution = bpy.props.IntProperty(
+    )),
+    ("blendermcp_hunyuan3d_octree_resolution", bpy.props.IntProperty(
         name="Octree Resolution",
         description="Octree resolution for the 3D generation",
         default=256,
         min=128,
         max=512,
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_num_inference_steps = bpy.props.IntProperty(
+    )),
+    ("blendermcp_hunyuan3d_num_inference_steps", bpy.props.IntProperty(
         name="Number of Inference Steps",
         description="Number of inference steps for the 3D generation",
         default=20,
         min=20,
         max=50,
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_guidance_scale = bpy.props.FloatProperty(
+    )),
+    ("blendermcp_hunyuan3d_guidance_scale", bpy.props.FloatProperty(
         name="Guidance Scale",
         description="Guidance scale for the 3D generation",
         default=5.5,
         min=1.0,
         max=10.0,
-    )
-
-    bpy.types.Scene.blendermcp_hunyuan3d_texture = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_hunyuan3d_texture", bpy.props.BoolProperty(
         name="Generate Texture",
         description="Whether to generate texture for the 3D model",
         default=False,
-    )
-    
-    bpy.types.Scene.blendermcp_use_sketchfab = bpy.props.BoolProperty(
+    )),
+    ("blendermcp_use_sketchfab", bpy.props.BoolProperty(
         name="Use Sketchfab",
         description="Enable Sketchfab asset integration",
         default=False
-    )
-
-    bpy.types.Scene.blendermcp_sketchfab_api_key = bpy.props.StringProperty(
+    )),
+    ("blendermcp_sketchfab_api_key", bpy.props.StringProperty(
         name="Sketchfab API Key",
         subtype="PASSWORD",
         description="API Key provided by Sketchfab",
         default=""
-    )
+    )),
+)
+
+# Registered in order and unregistered in reverse
+_CLASSES = (
+    BLENDERMCP_AddonPreferences,
+    BLENDERMCP_PT_Panel,
+    BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey,
+    BLENDERMCP_OT_StartServer,
+    BLENDERMCP_OT_StopServer,
+    BLENDERMCP_OT_OpenTerms,
+)
+
+# Registration functions
+def register():
+    for name, prop in _SCENE_PROPERTIES:
+        setattr(bpy.types.Scene, name, prop)
 
-    # Register preferences class
-    bpy.utils.register_class(BLENDERMCP_AddonPreferences)
+    for cls in _CLASSES:
+        bpy.utils.register_class(cls)
 
-    bpy.utils.register_class(BLENDERMCP_PT_Panel)
-    bpy.utils.register_class(BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey)
-    bpy.utils.register_class(BLENDERMCP_OT_StartServer)
-    bpy.utils.register_class(BLENDERMCP_OT_StopServer)
-    bpy.utils.register_class(BLENDERMCP_OT_OpenTerms)
+    bpy.app.handlers.depsgraph_update_post.append(_bump_scene_generation)
+    bpy.app.handlers.load_post.append(_bump_scene_generation)
 
     # Auto-start the server so the MCP client can connect without manual UI interaction
     scene = getattr(bpy.context, 'scene', None)
@@ -2843,7 +3236,7 @@ def register():
         except AttributeError:
             pass
 
-    print("BlenderMCP addon registered")
+    logger.info("BlenderMCP addon registered")
 
 def unregister():
     # Stop the server if it's running
@@ -2851,33 +3244,22 @@ def unregister():
         bpy.types.blendermcp_server.stop()
         del bpy.types.blendermcp_server
 
-    bpy.utils.unregister_class(BLENDERMCP_PT_Panel)
-    bpy.utils.unregister_class(BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey)
-    bpy.utils.unregister_class(BLENDERMCP_OT_StartServer)
-    bpy.utils.unregister_class(BLENDERMCP_OT_StopServer)
-    bpy.utils.unregister_class(BLENDERMCP_OT_OpenTerms)
-    bpy.utils.unregister_class(BLENDERMCP_AddonPreferences)
-
-    del bpy.types.Scene.blendermcp_port
-    del bpy.types.Scene.blendermcp_server_running
-    del bpy.types.Scene.blendermcp_auto_start_server
-    del bpy.types.Scene.blendermcp_use_polyhaven
-    del bpy.types.Scene.blendermcp_use_hyper3d
-    del bpy.types.Scene.blendermcp_hyper3d_mode
-    del bpy.types.Scene.blendermcp_hyper3d_api_key
-    del bpy.types.Scene.blendermcp_use_sketchfab
-    del bpy.types.Scene.blendermcp_sketchfab_api_key
-    del bpy.types.Scene.blendermcp_use_hunyuan3d
-    del bpy.types.Scene.blendermcp_hunyuan3d_mode
-    del bpy.types.Scene.blendermcp_hunyuan3d_secret_id
-    del bpy.types.Scene.blendermcp_hunyuan3d_secret_key
-    del bpy.types.Scene.blendermcp_hunyuan3d_api_url
-    del bpy.types.Scene.blendermcp_hunyuan3d_octree_resolution
-    del bpy.types.Scene.blendermcp_hunyuan3d_num_inference_steps
-    del bpy.types.Scene.blendermcp_hunyuan3d_guidance_scale
-    del bpy.types.Scene.blendermcp_hunyuan3d_texture
-
-    print("BlenderMCP addon unregistered")
+    global _http_session
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        if _bump_scene_generation in handlers:
+            handlers.remove(_bump_scene_generation)
+
+    for cls in reversed(_CLASSES):
+        bpy.utils.unregister_class(cls)
+
+    for name, _ in _SCENE_PROPERTIES:
+        delattr(bpy.types.Scene, name)
+
+    logger.info("BlenderMCP addon unregistered")
 
 if __name__ == "__main__":
     register()
@@ -27,6 +27,10 @@ logger = logging.getLogger("BlenderMCPServer")
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
 
+# Screenshots are handed over through a per-process temp file; both parts
+# of the path are fixed for the lifetime of the server
+SCREENSHOT_TEMP_PATH = os.path.join(tempfile.gettempdir(), f"blender_screenshot_{os.getpid()}.png")
+
 @dataclass
 class BlenderConnection:
     host: str
@@ -58,7 +62,7 @@ class BlenderConnection:
             finally:
                 self.sock = None
 
-    def receive_full_response(self, sock, buffer_size=8192):
+    def receive_full_response(self, sock, buffer_size=65536):
         """Receive the complete response, potentially in multiple chunks"""
         chunks = []
         # Use a consistent timeout value that matches the addon's timeout
@@ -75,11 +79,19 @@ class BlenderConnection:
                         break
                     
                     chunks.append(chunk)
-                    
+
+                    # Responses are single JSON objects, so they can only be
+                    # complete once the data ends in '}'. Skipping the parse
+                    # otherwise keeps large replies from being rejoined and
+                    # rescanned on every read.
+                    tail = chunk.rstrip()
+                    if tail and not tail.endswith(b'}'):
+                        continue
+
                     # Check if we've received a complete JSON object
                     try:
                         data = b''.join(chunks)
-                        json.loads(data.decode('utf-8'))
+                        json.loads(data)
                         # If we get here, it parsed successfully
                         logger.info(f"Received complete response ({len(data)} bytes)")
                         return data
@@ -309,10 +321,8 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 1000, user_prompt: str
     try:
         blender = get_blender_connection()
         
-        # Create temp file path
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_screenshot_{os.getpid()}.png")
-        
+        temp_path = SCREENSHOT_TEMP_PATH
+
         result = blender.send_command("get_viewport_screenshot", {
             "max_size": max_size,
             "filepath": temp_path,
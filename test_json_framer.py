@@ -0,0 +1,73 @@
+"""Behavioural check for the socket server's JSON framing.
+
+_JSONFramer is pure Python, so it is pulled out of addon.py with ast and
+exercised directly, without importing bpy.
+"""
+import ast
+import json
+import pathlib
+import re
+
+ADDON = pathlib.Path(__file__).with_name("addon.py")
+
+
+def _framer_class():
+    tree = ast.parse(ADDON.read_text())
+    wanted = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "_JSONFramer":
+            wanted.append(node)
+        elif isinstance(node, ast.Assign) and any(
+                getattr(t, "id", None) == "_json_frame_tokens" for t in node.targets):
+            wanted.append(node)
+    assert len(wanted) == 2, "expected _json_frame_tokens and _JSONFramer in addon.py"
+    namespace = {"re": re}
+    exec(compile(ast.Module(body=wanted, type_ignores=[]), str(ADDON), "exec"), namespace)
+    return namespace["_JSONFramer"]
+
+
+def _feed_all(chunks):
+    framer = _framer_class()()
+    frames = []
+    for chunk in chunks:
+        frames.extend(json.loads(f) for f in framer.feed(chunk))
+    return frames, framer
+
+
+def test_single_command():
+    frames, framer = _feed_all([b'{"type": "get_scene_info", "params": {}}'])
+    assert frames == [{"type": "get_scene_info", "params": {}}]
+    assert framer.buffer == b""
+
+
+def test_command_split_across_reads():
+    payload = json.dumps({"type": "execute_code", "params": {"code": "x = 1\n" * 5000}}).encode()
+    chunks = [payload[i:i + 997] for i in range(0, len(payload), 997)]
+    frames, _ = _feed_all(chunks)
+    assert frames == [json.loads(payload)]
+
+
+def test_back_to_back_commands_in_one_read():
+    frames, framer = _feed_all([b'{"type": "a"} {"type": "b"}\n{"type"'])
+    assert frames == [{"type": "a"}, {"type": "b"}]
+    assert framer.buffer == b'\n{"type"'
+
+
+def test_braces_and_escapes_inside_strings():
+    command = {"type": "execute_code", "params": {"code": 'print("}{\\"[")'}}
+    frames, _ = _feed_all([json.dumps(command).encode()])
+    assert frames == [command]
+
+
+def test_escape_split_at_read_boundary():
+    payload = json.dumps({"code": 'a\\"}b'}).encode()
+    cut = payload.index(b"\\") + 1
+    frames, _ = _feed_all([payload[:cut], payload[cut:]])
+    assert frames == [{"code": 'a\\"}b'}]
+
+
+def test_multibyte_text_split_at_read_boundary():
+    payload = json.dumps({"name": "café"}, ensure_ascii=False).encode()
+    cut = payload.index(b"\xc3") + 1
+    frames, _ = _feed_all([payload[:cut], payload[cut:]])
+    assert frames == [{"name": "café"}]
@@ -0,0 +1,93 @@
+"""Behavioural check for the viewport screenshot cache key.
+
+_screenshot_cache_key and _rna_state only read attributes, so they are pulled
+out of addon.py with ast and fed stand-ins for the bpy structs, checking that
+any change to the scene or viewport makes the last capture a cache miss.
+"""
+import ast
+import pathlib
+from types import SimpleNamespace
+
+import pytest
+
+ADDON = pathlib.Path(__file__).with_name("addon.py")
+
+
+def _key_namespace():
+    tree = ast.parse(ADDON.read_text())
+    wanted = [
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+        and node.name in ("_rna_state", "_screenshot_cache_key")
+    ]
+    assert len(wanted) == 2, "expected _rna_state and _screenshot_cache_key in addon.py"
+    namespace = {"_scene_generation": 0}
+    exec(compile(ast.Module(body=wanted, type_ignores=[]), str(ADDON), "exec"), namespace)
+    return namespace
+
+
+class _Struct:
+    """Minimal RNA struct: plain attributes described by bl_rna.properties."""
+
+    def __init__(self, **values):
+        props = [SimpleNamespace(identifier="rna_type", type='POINTER')]
+        for name, value in values.items():
+            props.append(SimpleNamespace(
+                identifier=name,
+                type='FLOAT' if isinstance(value, list) else 'ENUM',
+                is_array=isinstance(value, list),
+            ))
+            setattr(self, name, value)
+        self.rna_type = object()
+        self.bl_rna = SimpleNamespace(properties=props)
+
+
+def _viewport():
+    identity = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+    space = SimpleNamespace(
+        region_3d=SimpleNamespace(view_matrix=identity, window_matrix=identity),
+        shading=_Struct(type='SOLID', show_xray=False, color_type='MATERIAL',
+                        single_color=[0.8, 0.8, 0.8]),
+        overlay=_Struct(show_overlays=True, show_wireframes=False, show_floor=True,
+                        show_axis={'X', 'Y'}),
+    )
+    scene = SimpleNamespace(name="Scene", frame_current=1)
+    view_layer = SimpleNamespace(name="ViewLayer")
+    return scene, view_layer, space
+
+
+def _key(namespace, scene, view_layer, space):
+    return namespace["_screenshot_cache_key"](scene, view_layer, space, 800, 600, "png")
+
+
+def test_unchanged_viewport_hits():
+    namespace = _key_namespace()
+    key = _key(namespace, *_viewport())
+    assert key == _key(namespace, *_viewport())
+    hash(key)
+
+
+@pytest.mark.parametrize("change", [
+    lambda scene, layer, space: setattr(space.shading, "show_xray", True),
+    lambda scene, layer, space: setattr(space.shading, "color_type", 'OBJECT'),
+    lambda scene, layer, space: setattr(space.shading, "single_color", [1.0, 0.0, 0.0]),
+    lambda scene, layer, space: setattr(space.overlay, "show_wireframes", True),
+    lambda scene, layer, space: setattr(space.overlay, "show_axis", {'X'}),
+    lambda scene, layer, space: space.region_3d.view_matrix[0].__setitem__(3, 2.0),
+    lambda scene, layer, space: setattr(scene, "frame_current", 2),
+    lambda scene, layer, space: setattr(layer, "name", "Other"),
+])
+def test_changed_viewport_misses(change):
+    namespace = _key_namespace()
+    before = _key(namespace, *_viewport())
+    viewport = _viewport()
+    change(*viewport)
+    assert _key(namespace, *viewport) != before
+
+
+def test_scene_edit_misses():
+    namespace = _key_namespace()
+    before = _key(namespace, *_viewport())
+    # What _bump_scene_generation does on a depsgraph update or file load
+    namespace["_scene_generation"] += 1
+    assert _key(namespace, *_viewport()) != before
@@ -0,0 +1,104 @@
+"""Behavioural check for the parallel Poly Haven texture map download.
+
+_download_texture_maps and _copy_response only use the standard library, so
+they are pulled out of addon.py with ast and run against a fake HTTP session,
+without importing bpy or requests.
+"""
+import ast
+import io
+import os
+import pathlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+
+import pytest
+
+ADDON = pathlib.Path(__file__).with_name("addon.py")
+
+
+def _download_texture_maps():
+    tree = ast.parse(ADDON.read_text())
+    wanted = [
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+        and node.name in ("_copy_response", "_download_texture_maps")
+    ]
+    assert len(wanted) == 2, "expected _copy_response and _download_texture_maps in addon.py"
+    namespace = {
+        "os": os,
+        "shutil": shutil,
+        "tempfile": tempfile,
+        "suppress": suppress,
+        "ThreadPoolExecutor": ThreadPoolExecutor,
+        "TEXTURE_DOWNLOAD_WORKERS": 2,
+        "DOWNLOAD_CHUNK_SIZE": 4,
+    }
+    exec(compile(ast.Module(body=wanted, type_ignores=[]), str(ADDON), "exec"), namespace)
+    return namespace["_download_texture_maps"]
+
+
+class _Response:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+        self.headers = {}
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = responses
+        self.opened = []
+
+    def get(self, url, stream=False):
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        self.opened.append(response)
+        return response
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def test_failed_maps_are_skipped_and_removed(scratch):
+    session = _Session({
+        "u/diff": _Response(200, b"diffuse bytes"),
+        "u/rough": _Response(404),
+        "u/nor": _Response(200, b"normal"),
+    })
+    tmp_paths = {}
+    _download_texture_maps()(
+        session, {"diffuse": "u/diff", "rough": "u/rough", "nor": "u/nor"}, "jpg", tmp_paths)
+
+    assert sorted(tmp_paths) == ["diffuse", "nor"]
+    assert pathlib.Path(tmp_paths["diffuse"]).read_bytes() == b"diffuse bytes"
+    assert pathlib.Path(tmp_paths["nor"]).read_bytes() == b"normal"
+    # The 404's temp file is gone and every response was closed
+    assert sorted(os.listdir(scratch)) == sorted(os.path.basename(p) for p in tmp_paths.values())
+    assert all(response.closed for response in session.opened)
+
+
+def test_downloaded_maps_are_recorded_when_another_raises(scratch):
+    session = _Session({
+        "u/diff": _Response(200, b"diffuse bytes"),
+        "u/rough": ConnectionError("reset"),
+    })
+    tmp_paths = {}
+    with pytest.raises(ConnectionError):
+        _download_texture_maps()(
+            session, {"diffuse": "u/diff", "rough": "u/rough"}, "jpg", tmp_paths)
+
+    assert list(tmp_paths) == ["diffuse"]
+    assert os.listdir(scratch) == [os.path.basename(tmp_paths["diffuse"])]